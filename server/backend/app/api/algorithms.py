@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-import time
-from typing import Iterable
+import asyncio
+from typing import AsyncIterator, Iterable, Optional
 
-import cv2
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from ..dependencies import get_algorithm_manager
+from ..dependencies import get_algorithm_manager, get_camera_manager
 from ..services.algorithm_manager import AlgorithmManager, AlgorithmState
+from ..services.camera_manager import CameraManager
+from ..services.frame_encoding import MJPEG_MEDIA_TYPE
 
 router = APIRouter()
 
@@ -24,7 +25,8 @@ class AlgorithmInfo(BaseModel):
 
     @classmethod
     def from_state(cls, state: AlgorithmState) -> "AlgorithmInfo":
-        return cls(
+        # Fields come straight from typed manager state; FastAPI still checks the response model
+        return cls.model_construct(
             algorithm_id=state.algorithm_id,
             display_name=state.display_name,
             description=state.description,
@@ -58,7 +60,14 @@ def stop_algorithm(algorithm_id: str, manager: AlgorithmManager = Depends(get_al
 
 
 @router.get("/{algorithm_id}/stream/{camera_id}")
-def stream_algorithm_camera(algorithm_id: str, camera_id: str, manager: AlgorithmManager = Depends(get_algorithm_manager)) -> StreamingResponse:
+async def stream_algorithm_camera(
+    algorithm_id: str,
+    camera_id: str,
+    w: Optional[int] = Query(default=None, ge=16, description="缩放后的输出宽度（像素），仅在小于原始宽度时生效"),
+    fps: Optional[float] = Query(default=None, gt=0, le=120, description="输出帧率上限；客户端跟不上时只发送最新帧"),
+    manager: AlgorithmManager = Depends(get_algorithm_manager),
+    camera_manager: CameraManager = Depends(get_camera_manager),
+) -> StreamingResponse:
     state = manager.get_state(algorithm_id)
     if state is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="算法不存在")
@@ -66,38 +75,25 @@ def stream_algorithm_camera(algorithm_id: str, camera_id: str, manager: Algorith
     if not state.running:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="算法未运行")
 
-    required_cameras = list(state.required_cameras) if state.required_cameras else None
-    if required_cameras is not None and camera_id not in required_cameras:
+    if state.required_cameras and camera_id not in state.required_cameras:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="未订阅该摄像头")
 
-    boundary = "frame"
-
-    def iterator() -> Iterable[bytes]:
-        while True:
-            try:
-                frames = manager.get_latest_frames(algorithm_id)
-            except KeyError:
-                break
-
-            frame = frames.get(camera_id)
-            if frame is None:
-                time.sleep(0.05)
-                continue
-
-            success, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-            if not success:
-                time.sleep(0.05)
-                continue
-
-            payload = encoded.tobytes()
-            yield (
-                b"--" + boundary.encode() + b"\r\n"
-                b"Content-Type: image/jpeg\r\n"
-                b"Content-Length: " + str(len(payload)).encode() + b"\r\n\r\n" + payload + b"\r\n"
-            )
-            time.sleep(1.0 / 30.0)
+    subscription = camera_manager.subscribe(camera_id, asyncio.get_running_loop(), w, max_fps=fps)
+    if subscription is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="摄像头不存在")
 
-    headers = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
-    media_type = f"multipart/x-mixed-replace; boundary={boundary}"
-    return StreamingResponse(iterator(), media_type=media_type, headers=headers)
+    async def iterator() -> AsyncIterator[bytes]:
+        try:
+            while True:
+                encoded = await subscription.get()
+                try:
+                    manager.record_sample(algorithm_id, camera_id, encoded.shape)
+                except KeyError:
+                    break
+
+                yield encoded.part
+        finally:
+            camera_manager.unsubscribe(camera_id, subscription)
 
+    headers = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
+    return StreamingResponse(iterator(), media_type=MJPEG_MEDIA_TYPE, headers=headers)
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import time
-from typing import Iterable, Iterator
+import asyncio
+from typing import AsyncIterator, Iterable, Optional
 
-import cv2
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ..dependencies import get_camera_manager
 from ..services.camera_manager import CameraManager
+from ..services.frame_encoding import MJPEG_MEDIA_TYPE
+from ..services.h264_stream import MP4_MEDIA_TYPE, build_ffmpeg_command, find_ffmpeg, iter_h264
 
 router = APIRouter()
 
@@ -31,7 +33,7 @@ def list_cameras(camera_manager: CameraManager = Depends(get_camera_manager)) ->
     for camera_id, data in snapshot.items():
         config = data["config"]
         result.append(
-            CameraInfo(
+            CameraInfo.model_construct(
                 camera_id=camera_id,
                 display_name=config.display_name,
                 running=data["is_running"],
@@ -60,40 +62,71 @@ def stop_camera(camera_id: str, camera_manager: CameraManager = Depends(get_came
 
 
 @router.get("/{camera_id}/stream")
-def stream_camera(camera_id: str, camera_manager: CameraManager = Depends(get_camera_manager)) -> StreamingResponse:
+async def stream_camera(
+    camera_id: str,
+    w: Optional[int] = Query(default=None, ge=16, description="缩放后的输出宽度（像素），仅在小于原始宽度时生效"),
+    fps: Optional[float] = Query(default=None, gt=0, le=120, description="输出帧率上限；客户端跟不上时只发送最新帧"),
+    camera_manager: CameraManager = Depends(get_camera_manager),
+) -> StreamingResponse:
     config = camera_manager.get_config(camera_id)
     if config is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="摄像头不存在")
 
-    if not camera_manager.ensure_started(camera_id):
+    if not await run_in_threadpool(camera_manager.ensure_started, camera_id):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="摄像头启动失败")
 
-    def frame_iterator() -> Iterator[bytes]:
-        boundary = "--frame"
-        sleep_interval = 1.0 / max(config.fps, 1.0)
+    subscription = camera_manager.subscribe(camera_id, asyncio.get_running_loop(), w, max_fps=fps)
+    if subscription is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="摄像头不存在")
 
+    async def frame_iterator() -> AsyncIterator[bytes]:
         try:
             while True:
-                frame = camera_manager.get_frame(camera_id)
-                if frame is None:
-                    time.sleep(0.05)
-                    continue
-
-                success, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-                if not success:
-                    continue
-
-                payload = buffer.tobytes()
-                yield (
-                    b"%s\r\n"
-                    b"Content-Type: image/jpeg\r\n"
-                    b"Content-Length: %d\r\n\r\n%s\r\n"
-                    % (boundary.encode(), len(payload), payload)
-                )
-                time.sleep(sleep_interval)
-        except GeneratorExit:
-            return
+                # Wakes as soon as the capture thread publishes a frame; no fixed-rate sleep
+                encoded = await subscription.get()
+                yield encoded.part
+        finally:
+            camera_manager.unsubscribe(camera_id, subscription)
 
     headers = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
-    return StreamingResponse(frame_iterator(), media_type="multipart/x-mixed-replace; boundary=frame", headers=headers)
+    return StreamingResponse(frame_iterator(), media_type=MJPEG_MEDIA_TYPE, headers=headers)
+
+
+@router.get("/{camera_id}/stream.mp4")
+async def stream_camera_h264(camera_id: str, camera_manager: CameraManager = Depends(get_camera_manager)) -> StreamingResponse:
+    config = camera_manager.get_config(camera_id)
+    if config is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="摄像头不存在")
+
+    ffmpeg = find_ffmpeg()
+    if ffmpeg is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="未安装 ffmpeg，请改用 MJPEG 码流")
+
+    if not await run_in_threadpool(camera_manager.ensure_started, camera_id):
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="摄像头启动失败")
+
+    subscription = camera_manager.subscribe(camera_id, asyncio.get_running_loop(), raw=True)
+    if subscription is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="摄像头不存在")
+
+    try:
+        first = await asyncio.wait_for(subscription.get(), timeout=5.0)
+        process = await asyncio.create_subprocess_exec(
+            *build_ffmpeg_command(ffmpeg, first.shape, config.fps),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except (asyncio.TimeoutError, OSError):
+        camera_manager.unsubscribe(camera_id, subscription)
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="无法建立 H.264 码流")
+
+    async def chunk_iterator() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in iter_h264(process, subscription, first):
+                yield chunk
+        finally:
+            camera_manager.unsubscribe(camera_id, subscription)
 
+    headers = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
+    return StreamingResponse(chunk_iterator(), media_type=MP4_MEDIA_TYPE, headers=headers)
@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Iterable, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from ..dependencies import get_camera_manager, get_recording_manager
 from ..services.camera_manager import CameraManager
@@ -20,12 +20,17 @@ class RecordingRequest(BaseModel):
 class RecordingStatus(BaseModel):
     active: bool
     record_dir: Optional[str] = None
+    dropped_frames: dict[str, int] = Field(default_factory=dict)
 
 
 @router.get("/status", response_model=RecordingStatus)
 def get_status(recording_manager: RecordingManager = Depends(get_recording_manager)) -> RecordingStatus:
     record_dir = recording_manager.record_dir
-    return RecordingStatus(active=recording_manager.active, record_dir=str(record_dir) if record_dir else None)
+    return RecordingStatus(
+        active=recording_manager.active,
+        record_dir=str(record_dir) if record_dir else None,
+        dropped_frames=recording_manager.dropped_frames,
+    )
 
 
 @router.post("/start", response_model=RecordingStatus, status_code=status.HTTP_202_ACCEPTED)
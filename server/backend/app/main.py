@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -62,7 +63,8 @@ def create_app() -> FastAPI:
             "record_dir": str(app.state.recording_manager.record_dir) if app.state.recording_manager.record_dir else None,
         }
 
-        device_status = get_device_status()
+        # Device probes shell out; keep them off the event loop that also serves the live streams
+        device_status = await run_in_threadpool(get_device_status)
 
         algorithms = [
             {
@@ -77,9 +79,9 @@ def create_app() -> FastAPI:
         ]
 
         return templates.TemplateResponse(
+            request,
             "index.html",
             {
-                "request": request,
                 "page_title": "Smart Glasses Control Center",
                 "cameras": camera_cards,
                 "recording": recording_status,
@@ -93,12 +95,12 @@ def create_app() -> FastAPI:
         if app.state.camera_manager.get_config(camera_id) is None:
             return RedirectResponse(request.url_for("index"), status_code=303)
 
-        app.state.camera_manager.ensure_started(camera_id)
+        await run_in_threadpool(app.state.camera_manager.ensure_started, camera_id)
         return RedirectResponse(request.url_for("index"), status_code=303)
 
     @app.post("/cameras/{camera_id}/stop")
     async def dashboard_stop_camera(camera_id: str, request: Request) -> RedirectResponse:
-        app.state.camera_manager.stop(camera_id)
+        await run_in_threadpool(app.state.camera_manager.stop, camera_id)
         return RedirectResponse(request.url_for("index"), status_code=303)
 
     @app.post("/recording/start")
@@ -107,19 +109,19 @@ def create_app() -> FastAPI:
         recording_manager = app.state.recording_manager
         camera_ids = [cfg.camera_id for cfg in camera_manager.available_cameras()]
         for camera_id in camera_ids:
-            camera_manager.ensure_started(camera_id)
-        recording_manager.start(camera_ids)
+            await run_in_threadpool(camera_manager.ensure_started, camera_id)
+        await run_in_threadpool(recording_manager.start, camera_ids)
         return RedirectResponse(request.url_for("index"), status_code=303)
 
     @app.post("/recording/stop")
     async def dashboard_stop_recording(request: Request) -> RedirectResponse:
-        app.state.recording_manager.stop()
+        await run_in_threadpool(app.state.recording_manager.stop)
         return RedirectResponse(request.url_for("index"), status_code=303)
 
     @app.post("/algorithms/{algorithm_id}/start")
     async def dashboard_start_algorithm(algorithm_id: str, request: Request) -> RedirectResponse:
         try:
-            app.state.algorithm_manager.start(algorithm_id)
+            await run_in_threadpool(app.state.algorithm_manager.start, algorithm_id)
         except KeyError:
             pass
         return RedirectResponse(request.url_for("index"), status_code=303)
@@ -3,22 +3,56 @@ from __future__ import annotations
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional
 
 import numpy as np
 
 from .camera_manager import CameraManager
 
 
+_NOT_SAMPLED = -1
+
+
 @dataclass
 class AlgorithmState:
     algorithm_id: str
     display_name: str
     description: str
-    required_cameras: Iterable[str] = field(default_factory=list)
+    # Normalized to a tuple; empty until the manager resolves it to every available camera
+    required_cameras: tuple[str, ...] = ()
     running: bool = False
     last_sample_at: Optional[float] = None
-    last_frame_shapes: Dict[str, Optional[tuple[int, ...]]] = field(default_factory=dict)
+    # One (h, w, c) row per camera, updated in place: -1 = never sampled, zeros = sampled without a frame
+    frame_shapes: np.ndarray = field(init=False, repr=False)
+    camera_index: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.bind_cameras(self.required_cameras)
+
+    def bind_cameras(self, camera_ids: Iterable[str]) -> None:
+        self.required_cameras = tuple(camera_ids)
+        self.camera_index = {camera_id: idx for idx, camera_id in enumerate(self.required_cameras)}
+        self.frame_shapes = np.full((len(self.camera_index), 3), _NOT_SAMPLED, dtype=np.int32)
+
+    def set_frame_shape(self, camera_id: str, shape: Optional[tuple[int, ...]]) -> None:
+        idx = self.camera_index.get(camera_id)
+        if idx is None:
+            return
+        row = self.frame_shapes[idx]
+        row[:] = 0
+        if shape is not None:
+            row[: len(shape)] = shape
+
+    @property
+    def last_frame_shapes(self) -> Dict[str, Optional[tuple[int, ...]]]:
+        shapes: Dict[str, Optional[tuple[int, ...]]] = {}
+        for camera_id, idx in self.camera_index.items():
+            row = self.frame_shapes[idx]
+            if row[0] == _NOT_SAMPLED:
+                continue
+            shapes[camera_id] = tuple(int(dim) for dim in row if dim) or None
+        return shapes
 
 
 class AlgorithmManager:
@@ -31,84 +65,85 @@ class AlgorithmManager:
                 algorithm_id="eye_tracking",
                 display_name="眼动算法",
                 description="基于双目近眼红外摄像头的眼动识别算法。",
-                required_cameras=["eye0", "eye1", "world"],
+                required_cameras=("eye0", "eye1", "world"),
             ),
         }
+        # The registry is fixed after construction; readers go through the read-only view without the
+        # lock, which only serializes field updates on individual states.
+        self._states_view: Mapping[str, AlgorithmState] = MappingProxyType(self._states)
         self._lock = threading.Lock()
 
     def list_algorithms(self) -> Iterable[AlgorithmState]:
-        with self._lock:
-            return list(self._states.values())
+        return list(self._states_view.values())
 
     def get_state(self, algorithm_id: str) -> Optional[AlgorithmState]:
-        with self._lock:
-            return self._states.get(algorithm_id)
+        return self._states_view.get(algorithm_id)
 
     def start(self, algorithm_id: str) -> AlgorithmState:
-        with self._lock:
-            state = self._states.get(algorithm_id)
-            if state is None:
-                raise KeyError(algorithm_id)
+        state = self._states_view.get(algorithm_id)
+        if state is None:
+            raise KeyError(algorithm_id)
 
+        with self._lock:
             if state.running:
                 return state
 
-            required_cameras = (
-                list(state.required_cameras) if state.required_cameras else [cfg.camera_id for cfg in self._camera_manager.available_cameras()]
-            )
-            state.required_cameras = required_cameras
+            required_cameras = self._resolve_cameras(state)
+            for camera_id in required_cameras:
+                self._camera_manager.add_consumer(camera_id)
+            state.running = True
 
+        # Camera I/O runs outside the lock; ``state`` is the same object the dict holds
         for camera_id in required_cameras:
             self._camera_manager.ensure_started(camera_id)
 
-        # Snapshot current frame metadata
-        frame_shapes: Dict[str, Optional[tuple[int, ...]]] = {}
-        for camera_id in required_cameras:
-            frame = self._camera_manager.get_frame(camera_id)
-            frame_shapes[camera_id] = frame.shape if frame is not None else None
-        
+        for camera_id, frame in self._camera_manager.get_frames(required_cameras).items():
+            state.set_frame_shape(camera_id, frame.shape if frame is not None else None)
 
-        with self._lock:
-            state = self._states.get(algorithm_id)
-            if state is None:
-                raise KeyError(algorithm_id)
-            state.last_sample_at = time.time()
-            state.last_frame_shapes = frame_shapes
-            state.running = True
-            return state
+        state.last_sample_at = time.time()
+        return state
 
     def stop(self, algorithm_id: str) -> AlgorithmState:
-        with self._lock:
-            state = self._states.get(algorithm_id)
-            if state is None:
-                raise KeyError(algorithm_id)
+        state = self._states_view.get(algorithm_id)
+        if state is None:
+            raise KeyError(algorithm_id)
 
+        with self._lock:
+            if state.running:
+                for camera_id in state.required_cameras:
+                    self._camera_manager.remove_consumer(camera_id)
             state.running = False
             return state
 
     def get_latest_frames(self, algorithm_id: str) -> Dict[str, Optional[np.ndarray]]:
+        """Return read-only views of the newest frames; copy them to keep beyond a few frame periods."""
+        state = self._states_view.get(algorithm_id)
+        if state is None:
+            raise KeyError(algorithm_id)
+        camera_ids = state.required_cameras
+        if not camera_ids:
+            with self._lock:
+                camera_ids = self._resolve_cameras(state)
+
+        frames = self._camera_manager.get_frames(camera_ids)
         with self._lock:
-            state = self._states.get(algorithm_id)
-            if state is None:
-                raise KeyError(algorithm_id)
-            camera_ids = list(state.required_cameras) if state.required_cameras else [
-                cfg.camera_id for cfg in self._camera_manager.available_cameras()
-            ]
-
-        frames: Dict[str, Optional[np.ndarray]] = {}
-        shapes: Dict[str, Optional[tuple[int, ...]]] = {}
-        for camera_id in camera_ids:
-            frame = self._camera_manager.get_frame(camera_id)
-            frames[camera_id] = frame.copy() if frame is not None else None
-            shapes[camera_id] = frame.shape if frame is not None else None
-
-        with self._lock:
-            state = self._states.get(algorithm_id)
-            if state is None:
-                raise KeyError(algorithm_id)
             state.last_sample_at = time.time()
-            state.last_frame_shapes = shapes
+            for camera_id, frame in frames.items():
+                state.set_frame_shape(camera_id, frame.shape if frame is not None else None)
 
         return frames
 
+    def record_sample(self, algorithm_id: str, camera_id: str, shape: tuple[int, ...]) -> None:
+        state = self._states_view.get(algorithm_id)
+        if state is None:
+            raise KeyError(algorithm_id)
+
+        with self._lock:
+            state.last_sample_at = time.time()
+            state.set_frame_shape(camera_id, shape)
 
+    def _resolve_cameras(self, state: AlgorithmState) -> tuple[str, ...]:
+        # Caller holds the lock; defaults are resolved once and then reused as-is
+        if not state.required_cameras:
+            state.bind_cameras(cfg.camera_id for cfg in self._camera_manager.available_cameras())
+        return state.required_cameras
@@ -1,24 +1,134 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import operator
 import os
 import platform
 import threading
 import time
-from typing import Dict, Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterable, Optional
 
 import cv2
 import numpy as np
 
-from .camera_types import CameraConfig, FrameTransform
+from .camera_types import CameraConfig, EncodedFrame, FrameTransform, RawFrame
+from .frame_encoding import encode_jpeg, mjpeg_part
+from .frame_ring import FrameRing
+
+try:
+    import uvc as _uvc
+except ImportError:
+    _uvc = None
 
 LOGGER = logging.getLogger(__name__)
 
 ASSIGNED_LIBUVC_UIDS: set[str] = set()
 
+# Preallocated output slots per camera; a frame view stays valid until the producer laps the ring.
+FRAME_SLOTS = 3
+
+_QUARTER_TURNS = {cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE}
+
+TransformFn = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+# A grab() that returns faster than this was served from the driver queue, not the sensor
+STALE_GRAB_SECONDS = 0.002
+# Upper bound on extra grabs per frame when draining queued frames
+STALE_DRAIN_LIMIT = 8
+
+# With no consumer attached, still decode about once per interval so status and snapshots stay fresh.
+IDLE_DECODE_INTERVAL = 1.0
+
+# JPEG/resize calls release the GIL, so a small shared pool encodes several cameras in parallel
+# without holding up their capture loops.
+_ENCODE_POOL = ThreadPoolExecutor(max_workers=max(2, min(4, os.cpu_count() or 1)), thread_name_prefix="frame-encode")
+
+
+@dataclass(frozen=True)
+class _UvcDeviceIndex:
+    """One ``uvc.device_list()`` result indexed by uid and by (vendor, product)."""
+
+    devices: tuple[dict, ...]
+    by_uid: Dict[str, dict]
+    by_vid_pid: Dict[tuple[Optional[int], Optional[int]], tuple[dict, ...]]
+
+    @classmethod
+    def build(cls, devices: Iterable[dict]) -> "_UvcDeviceIndex":
+        devices = tuple(devices)
+        grouped: Dict[tuple[Optional[int], Optional[int]], list[dict]] = {}
+        for dev in devices:
+            grouped.setdefault((dev.get("idVendor"), dev.get("idProduct")), []).append(dev)
+        return cls(
+            devices=devices,
+            by_uid={dev["uid"]: dev for dev in devices if dev.get("uid")},
+            by_vid_pid={key: tuple(group) for key, group in grouped.items()},
+        )
+
+    def candidates(self, uid: Optional[str], vendor_id: Optional[int], product_id: Optional[int]) -> Iterable[dict]:
+        if uid:
+            dev = self.by_uid.get(uid)
+            return (dev,) if dev is not None else ()
+        if vendor_id is not None and product_id is not None:
+            return self.by_vid_pid.get((vendor_id, product_id), ())
+        return self.devices
+
+
+class FrameSubscription:
+    """Hand frames from a capture thread to one asyncio consumer, keeping only the newest.
+
+    JPEG subscriptions receive ``EncodedFrame`` parts, raw ones receive ``RawFrame`` pixel bytes.
+    With ``max_fps`` set, ``get`` paces delivery against a deadline; frames published while the
+    consumer waits simply replace each other, so a slow client always resumes on the newest one.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        width: Optional[int] = None,
+        raw: bool = False,
+        max_fps: Optional[float] = None,
+    ) -> None:
+        self.width = width
+        self.raw = raw
+        self._loop = loop
+        self._queue: asyncio.Queue[EncodedFrame | RawFrame] = asyncio.Queue(maxsize=1)
+        self._interval = 1.0 / max_fps if max_fps else 0.0
+        self._deadline = loop.time()
+
+    def offer(self, frame: EncodedFrame | RawFrame) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._put_latest, frame)
+        except RuntimeError:
+            # event loop already closed; the consumer is gone
+            pass
+
+    async def get(self) -> EncodedFrame | RawFrame:
+        if not self._interval:
+            return await self._queue.get()
+
+        delay = self._deadline - self._loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        frame = await self._queue.get()
+        # Behind schedule: resync to now instead of bursting through the missed ticks
+        self._deadline = max(self._deadline + self._interval, self._loop.time())
+        return frame
+
+    def _put_latest(self, frame: EncodedFrame | RawFrame) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(frame)
+
 
 class CameraStream:
-    """Manage individual camera capture loop."""
+    """Manage individual camera capture loop.
+
+    Each stream keeps its own capture thread: neither OpenCV nor pyuvc exposes a pollable device
+    fd, and the blocking grab/retrieve/get_frame calls release the GIL while they wait.
+    """
 
     def __init__(self, config: CameraConfig) -> None:
         self.config = config
@@ -28,8 +138,21 @@ class CameraStream:
         self._thread: Optional[threading.Thread] = None
         self._running = threading.Event()
         self._frame_lock = threading.Lock()
-        self._latest_frame: Optional[np.ndarray] = None
-        self._latest_timestamp: float = 0.0
+        # (frame, timestamp) published as one reference so lock-free readers never see a torn pair
+        self._latest: Optional[tuple[np.ndarray, float]] = None
+        self._frame_seq = 0
+        self._frame_slots: Optional[np.ndarray] = None
+        self._slot_cursor = 0
+        self._encoding_slot: Optional[int] = None
+        self._consumers = 0
+        self._subscribers: tuple[FrameSubscription, ...] = ()
+        self._rings: tuple[FrameRing, ...] = ()
+        # Per-frame plan, fixed for the stream's lifetime (config replacements only pin the device)
+        self._transform = _compile_transform(config.transform)
+        self._swaps_axes = config.transform.rotate_code in _QUARTER_TURNS
+        self._gray_output = config.pixel_format == "gray"
+        self._gray_scratch: Optional[np.ndarray] = None
+        self._convert_scratch: Optional[np.ndarray] = None
 
     def start(self) -> bool:
         if self.is_running:
@@ -54,15 +177,15 @@ class CameraStream:
 
         self._configure_capture()
         self._running.set()
-        self._thread = threading.Thread(target=self._capture_loop_opencv, daemon=True)
+        self._thread = threading.Thread(
+            target=self._capture_loop_opencv, name=f"capture-{self.config.camera_id}", daemon=True
+        )
         self._thread.start()
         LOGGER.info("Camera %s started", self.config.camera_id)
         return True
 
     def _start_libuvc(self) -> bool:
-        try:
-            import uvc
-        except ImportError:
+        if _uvc is None:
             LOGGER.error("pyuvc 未安装，无法访问摄像头 %s", self.config.camera_id)
             return False
 
@@ -71,13 +194,13 @@ class CameraStream:
             self._uvc_uid = None
 
         try:
-            devices = uvc.device_list()
+            devices = _uvc.device_list()
         except Exception as exc:  # noqa: BLE001
             LOGGER.exception("列举 UVC 设备失败: %s", exc)
             return False
 
-        used_uids = ASSIGNED_LIBUVC_UIDS.copy()
-        target = self._select_uvc_device(devices, used_uids)
+        # CameraManager holds its lock across start(), so the live set cannot change under us
+        target = self._select_uvc_device(_UvcDeviceIndex.build(devices), ASSIGNED_LIBUVC_UIDS)
         if target is None:
             LOGGER.error(
                 "未找到匹配的红外摄像头 (vendor=%s, product=%s, uid=%s, address=%s) 对应 %s",
@@ -90,10 +213,17 @@ class CameraStream:
             return False
 
         try:
-            self._uvc_capture = uvc.Capture(target["uid"])
-            self.config.device_uid = target.get("uid")
-            if self.config.device_address is None:
-                self.config.device_address = target.get("device_address")
+            self._uvc_capture = _uvc.Capture(target["uid"])
+            # Pin the resolved device so a restart reopens the same camera
+            self.config = replace(
+                self.config,
+                device_uid=target.get("uid"),
+                device_address=(
+                    self.config.device_address
+                    if self.config.device_address is not None
+                    else target.get("device_address")
+                ),
+            )
             self._apply_uvc_mode()
             self._uvc_uid = self.config.device_uid
             if self._uvc_uid:
@@ -104,36 +234,38 @@ class CameraStream:
             return False
 
         self._running.set()
-        self._thread = threading.Thread(target=self._capture_loop_libuvc, daemon=True)
+        self._thread = threading.Thread(
+            target=self._capture_loop_libuvc, name=f"capture-{self.config.camera_id}", daemon=True
+        )
         self._thread.start()
         LOGGER.info("Camera %s started (libuvc, uid=%s)", self.config.camera_id, self.config.device_uid)
         return True
 
-    def _select_uvc_device(self, devices: list[dict], used_uids: set[str]) -> Optional[dict]:
+    def _select_uvc_device(self, index: _UvcDeviceIndex, used_uids: set[str]) -> Optional[dict]:
+        config = self.config
+
         def matches(device: dict) -> bool:
-            if self.config.device_uid and device.get("uid") != self.config.device_uid:
-                return False
-            if self.config.device_address is not None and device.get("device_address") != self.config.device_address:
+            if config.device_address is not None and device.get("device_address") != config.device_address:
                 return False
-            if self.config.vendor_id is not None and device.get("idVendor") != self.config.vendor_id:
+            if config.vendor_id is not None and device.get("idVendor") != config.vendor_id:
                 return False
-            if self.config.product_id is not None and device.get("idProduct") != self.config.product_id:
+            if config.product_id is not None and device.get("idProduct") != config.product_id:
                 return False
-            if self.config.serial_number is not None and device.get("serialNumber") != self.config.serial_number:
+            if config.serial_number is not None and device.get("serialNumber") != config.serial_number:
                 return False
             return True
 
-        # exact match
-        for dev in devices:
+        # exact match; the index already narrows by uid or (vendor, product)
+        for dev in index.candidates(config.device_uid, config.vendor_id, config.product_id):
             if matches(dev) and dev.get("uid") not in used_uids:
                 return dev
 
         # fallback: try ignoring uid/address if not specified
-        for dev in devices:
+        for dev in index.candidates(None, config.vendor_id, config.product_id):
             if dev.get("uid") in used_uids:
                 continue
-            if self.config.vendor_id is None or dev.get("idVendor") == self.config.vendor_id:
-                if self.config.product_id is None or dev.get("idProduct") == self.config.product_id:
+            if config.vendor_id is None or dev.get("idVendor") == config.vendor_id:
+                if config.product_id is None or dev.get("idProduct") == config.product_id:
                     return dev
         return None
 
@@ -186,14 +318,181 @@ class CameraStream:
         return self._running.is_set()
 
     def get_frame(self) -> Optional[np.ndarray]:
-        with self._frame_lock:
-            if self._latest_frame is None:
-                return None
-            return self._latest_frame.copy()
+        """Return a private copy of the newest frame; prefer ``get_frame_view`` for read-only use."""
+        # The published slot is swapped by a single reference store and only reused FRAME_SLOTS - 1
+        # frames later at the earliest, so the copy does not need to hold up the producer
+        latest = self._latest
+        if latest is None:
+            return None
+        return latest[0].copy()
+
+    def get_frame_view(self, min_timestamp: Optional[float] = None) -> Optional[np.ndarray]:
+        """Return a read-only view of the newest frame without copying it.
+
+        The view aliases a ring slot that is rewritten ``FRAME_SLOTS`` publishes later, or
+        ``FRAME_SLOTS - 1`` (about two frame periods) while an encode pins another slot; copy it to
+        keep it longer. With ``min_timestamp``, frames captured at or before that time are treated
+        as absent.
+        """
+        latest = self._latest
+        if latest is None:
+            return None
+        frame, timestamp = latest
+        if min_timestamp is not None and timestamp <= min_timestamp:
+            return None
+        view = frame.view()
+        view.flags.writeable = False
+        return view
 
     def get_timestamp(self) -> float:
+        latest = self._latest
+        return latest[1] if latest is not None else 0.0
+
+    def add_consumer(self) -> None:
         with self._frame_lock:
-            return self._latest_timestamp
+            self._consumers += 1
+
+    def remove_consumer(self) -> None:
+        with self._frame_lock:
+            self._consumers = max(self._consumers - 1, 0)
+
+    def needs_pixels(self) -> bool:
+        if self._consumers > 0 or self._subscribers:
+            return True
+        return time.time() - self.get_timestamp() >= IDLE_DECODE_INTERVAL
+
+    def subscribe(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        width: Optional[int] = None,
+        raw: bool = False,
+        max_fps: Optional[float] = None,
+    ) -> FrameSubscription:
+        subscription = FrameSubscription(loop, width, raw, max_fps)
+        with self._frame_lock:
+            self._subscribers = (*self._subscribers, subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: FrameSubscription) -> None:
+        with self._frame_lock:
+            self._subscribers = tuple(sub for sub in self._subscribers if sub is not subscription)
+
+    def attach_ring(self, ring: FrameRing) -> None:
+        """Queue every published frame into ``ring`` until detached (one ring per consumer)."""
+        with self._frame_lock:
+            self._rings = (*self._rings, ring)
+
+    def detach_ring(self, ring: FrameRing) -> None:
+        with self._frame_lock:
+            self._rings = tuple(item for item in self._rings if item is not ring)
+
+    def _publish_frame(self, raw: np.ndarray) -> None:
+        """Transform ``raw`` into the next slot, converting it to the configured pixel format first."""
+        if self._gray_output:
+            if raw.ndim == 3:
+                # Convert before the transform so rotate/flip only touch one plane
+                scratch = self._convert_scratch
+                if scratch is None or scratch.shape != raw.shape[:2] or scratch.dtype != raw.dtype:
+                    scratch = self._convert_scratch = np.empty(raw.shape[:2], dtype=raw.dtype)
+                raw = cv2.cvtColor(raw, cv2.COLOR_BGR2GRAY, scratch)
+        elif raw.ndim == 2:
+            self._publish_gray_as_bgr(raw)
+            return
+
+        self._publish(self._transform(raw, self._next_slot(self._output_shape(raw.shape), raw.dtype)))
+
+    def _publish_gray_as_bgr(self, gray: np.ndarray) -> None:
+        # Rotate/flip the single plane, then expand straight into the slot: the 3-channel frame is
+        # written once instead of being built in a scratch buffer and copied again by the transform
+        shape = self._output_shape(gray.shape)
+        scratch = self._gray_scratch
+        if scratch is None or scratch.shape != shape or scratch.dtype != gray.dtype:
+            scratch = self._gray_scratch = np.empty(shape, dtype=gray.dtype)
+        self._transform(gray, scratch)
+        slot = self._next_slot((*shape, 3), gray.dtype)
+        self._publish(cv2.cvtColor(scratch, cv2.COLOR_GRAY2BGR, slot))
+
+    def _publish(self, frame: np.ndarray) -> None:
+        timestamp = time.time()
+        with self._frame_lock:
+            self._latest = (frame, timestamp)
+            self._frame_seq += 1
+            seq = self._frame_seq
+
+        for ring in self._rings:
+            ring.push(frame, timestamp)
+
+        # While the previous frame is still being encoded, viewers simply skip this one
+        subscribers = self._subscribers
+        if not subscribers or self._encoding_slot is not None:
+            return
+
+        self._encoding_slot = self._slot_cursor
+        _ENCODE_POOL.submit(self._fan_out, frame, seq, subscribers)
+
+    def _fan_out(self, frame: np.ndarray, seq: int, subscribers: tuple[FrameSubscription, ...]) -> None:
+        deliveries: list[tuple[FrameSubscription, EncodedFrame | RawFrame]] = []
+        try:
+            deliveries = self._prepare_deliveries(frame, seq, subscribers)
+        except Exception:  # noqa: BLE001
+            LOGGER.exception("编码摄像头 %s 的预览帧失败", self.config.camera_id)
+        finally:
+            # The slot is no longer read once the bytes exist; let the producer reuse it
+            self._encoding_slot = None
+
+        for subscription, item in deliveries:
+            subscription.offer(item)
+
+    def _prepare_deliveries(
+        self,
+        frame: np.ndarray,
+        seq: int,
+        subscribers: tuple[FrameSubscription, ...],
+    ) -> list[tuple[FrameSubscription, EncodedFrame | RawFrame]]:
+        # Prepare each requested variant once, then fan the same bytes out to every viewer
+        prepared: Dict[tuple[bool, Optional[int]], EncodedFrame | RawFrame | None] = {}
+        deliveries: list[tuple[FrameSubscription, EncodedFrame | RawFrame]] = []
+        for subscription in subscribers:
+            key = (subscription.raw, subscription.width)
+            if key not in prepared:
+                if subscription.raw:
+                    prepared[key] = RawFrame(seq=seq, data=frame.tobytes(), shape=frame.shape)
+                else:
+                    prepared[key] = self._encode_frame(frame, seq, subscription.width)
+            item = prepared[key]
+            if item is not None:
+                deliveries.append((subscription, item))
+        return deliveries
+
+    @staticmethod
+    def _encode_frame(frame: np.ndarray, seq: int, width: Optional[int]) -> Optional[EncodedFrame]:
+        image = frame
+        if width is not None and width < frame.shape[1]:
+            height = max(round(frame.shape[0] * width / frame.shape[1]), 1)
+            image = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+
+        payload = encode_jpeg(image)
+        if payload is None:
+            return None
+        return EncodedFrame(seq=seq, part=mjpeg_part(payload), shape=frame.shape)
+
+    def _output_shape(self, shape: tuple[int, ...]) -> tuple[int, ...]:
+        if self._swaps_axes:
+            return (shape[1], shape[0], *shape[2:])
+        return tuple(shape)
+
+    def _next_slot(self, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        slots = self._frame_slots
+        if slots is None or slots.shape[1:] != shape or slots.dtype != dtype:
+            slots = np.empty((FRAME_SLOTS, *shape), dtype=dtype)
+            self._frame_slots = slots
+
+        # Never overwrite the slot the encoder pool is still reading
+        index = (self._slot_cursor + 1) % FRAME_SLOTS
+        if index == self._encoding_slot:
+            index = (index + 1) % FRAME_SLOTS
+        self._slot_cursor = index
+        return slots[index]
 
     def _configure_capture(self) -> None:
         if self.capture is None:
@@ -203,6 +502,14 @@ class CameraStream:
         self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, float(self.config.frame_height))
         self.capture.set(cv2.CAP_PROP_FPS, float(self.config.fps))
 
+        # Drivers queue several frames by default; keep only the newest so grab() never returns stale ones
+        if not self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            LOGGER.warning(
+                "摄像头 %s 的后端 %s 不支持 CAP_PROP_BUFFERSIZE，可能存在额外缓冲延迟",
+                self.config.camera_id,
+                self.capture.getBackendName(),
+            )
+
         if self.config.fourcc:
             fourcc_value = cv2.VideoWriter_fourcc(*self.config.fourcc)
             self.capture.set(cv2.CAP_PROP_FOURCC, fourcc_value)
@@ -212,33 +519,49 @@ class CameraStream:
         backoff = 0.05
 
         while self._running.is_set():
-            ret, frame = self.capture.read()
+            # grab() only dequeues the buffer; decoding happens in retrieve() when someone needs pixels
+            started = time.perf_counter()
+            if not self.capture.grab():
+                LOGGER.warning("Failed to grab frame from %s, retrying", self.config.camera_id)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 1.0)
+                continue
+            grab_seconds = time.perf_counter() - started
+
+            backoff = 0.05
+            if not self.needs_pixels():
+                continue
+
+            if self.config.drain_stale and grab_seconds < STALE_GRAB_SECONDS:
+                self._drain_stale_frames()
+
+            ret, frame = self.capture.retrieve()
             if not ret or frame is None:
                 LOGGER.warning("Failed to read frame from %s, retrying", self.config.camera_id)
                 time.sleep(backoff)
                 backoff = min(backoff * 2, 1.0)
                 continue
 
-            frame = self._apply_transform(frame, self.config.transform)
-            with self._frame_lock:
-                self._latest_frame = frame
-                self._latest_timestamp = time.time()
-            backoff = 0.05
+            self._publish_frame(frame)
 
-    def _capture_loop_libuvc(self) -> None:
-        try:
-            import uvc
-        except ImportError:  # pragma: no cover
-            LOGGER.error("pyuvc 未安装")
-            self._running.clear()
-            return
+    def _drain_stale_frames(self) -> None:
+        # For backends that ignore CAP_PROP_BUFFERSIZE: keep grabbing until one actually waits
+        assert self.capture is not None
+        for _ in range(STALE_DRAIN_LIMIT):
+            started = time.perf_counter()
+            if not self.capture.grab() or time.perf_counter() - started >= STALE_GRAB_SECONDS:
+                return
 
-        capture: Optional[uvc.Capture] = self._uvc_capture
+    def _capture_loop_libuvc(self) -> None:
+        capture = self._uvc_capture
         if capture is None:
             LOGGER.error("libuvc capture 未初始化")
             self._running.clear()
             return
 
+        to_numpy: Optional[Callable[[Any], Optional[np.ndarray]]] = None
+        # pyuvc has no frame-callback API, so this thread pulls frames; get_frame blocks inside
+        # libuvc and the per-frame Python work below is kept to the accessor call and one publish
         while self._running.is_set():
             try:
                 frame = capture.get_frame(timeout=1.0)
@@ -251,43 +574,97 @@ class CameraStream:
                 time.sleep(0.05)
                 continue
 
-            np_frame: Optional[np.ndarray] = None
-            if hasattr(frame, "bgr"):
-                np_frame = frame.bgr
-            elif hasattr(frame, "img"):
-                np_frame = frame.img
-            else:
-                try:
-                    np_frame = frame.asarray(np.uint8)  # type: ignore[attr-defined]
-                except Exception:  # noqa: BLE001
-                    LOGGER.debug("无法转换帧为 numpy", exc_info=True)
-                    time.sleep(0.01)
-                    continue
+            # pyuvc decodes lazily on pixel access, so idle frames are dropped undecoded
+            if not self.needs_pixels():
+                continue
+
+            if to_numpy is None:
+                # Every frame from one capture has the same type, so probe its accessors only once
+                to_numpy = _uvc_frame_adapter(frame, self.config.pixel_format)
+            try:
+                np_frame = to_numpy(frame)
+            except Exception:  # noqa: BLE001
+                LOGGER.debug("无法转换帧为 numpy", exc_info=True)
+                time.sleep(0.01)
+                continue
 
             if np_frame is None:
                 time.sleep(0.01)
                 continue
 
-            if np_frame.ndim == 2:
-                np_frame = cv2.cvtColor(np_frame, cv2.COLOR_GRAY2BGR)
+            self._publish_frame(np_frame)
 
-            np_frame = self._apply_transform(np_frame, self.config.transform)
-            with self._frame_lock:
-                self._latest_frame = np_frame
-                self._latest_timestamp = time.time()
 
-    @staticmethod
-    def _apply_transform(frame: np.ndarray, transform: FrameTransform) -> np.ndarray:
-        if transform.rotate_code is not None:
-            frame = cv2.rotate(frame, transform.rotate_code)
+def _uvc_frame_adapter(frame: Any, pixel_format: str) -> Callable[[Any], Optional[np.ndarray]]:
+    # pyuvc's ``gray`` is the decoded Y plane, which skips the colour conversion entirely
+    if pixel_format == "gray" and hasattr(frame, "gray"):
+        return operator.attrgetter("gray")
+    if hasattr(frame, "bgr"):
+        return operator.attrgetter("bgr")
+    if hasattr(frame, "img"):
+        return operator.attrgetter("img")
 
-        if transform.flip_horizontal:
-            frame = cv2.flip(frame, 1)
+    def as_array(uvc_frame: Any) -> np.ndarray:
+        return uvc_frame.asarray(np.uint8)  # type: ignore[attr-defined]
 
-        if transform.flip_vertical:
-            frame = cv2.flip(frame, 0)
+    return as_array
 
-        return frame
+
+def _copy(frame: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    if out is None:
+        return frame.copy()
+    np.copyto(out, frame)
+    return out
+
+
+def _transpose(frame: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    return cv2.transpose(frame, out)
+
+
+def _anti_transpose(frame: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    transposed = cv2.transpose(frame, out)
+    return cv2.flip(transposed, -1, transposed)
+
+
+def _rotate_op(rotate_code: int) -> TransformFn:
+    def rotate(frame: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        return cv2.rotate(frame, rotate_code, out)
+
+    return rotate
+
+
+def _flip_op(flip_code: int) -> TransformFn:
+    def flip(frame: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        return cv2.flip(frame, flip_code, out)
+
+    return flip
+
+
+# These cover every rotate/flip combination; each is a single vectorized pass except the
+# anti-transpose, whose second pass is an in-place flip
+_PLANE_OPS: tuple[TransformFn, ...] = (
+    _copy,
+    _transpose,
+    _anti_transpose,
+    *(_rotate_op(code) for code in (cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_180, cv2.ROTATE_90_COUNTERCLOCKWISE)),
+    *(_flip_op(code) for code in (1, 0)),
+)
+
+
+def _compile_transform(transform: FrameTransform) -> TransformFn:
+    """Reduce rotate + flips to the one OpenCV op that writes the same image into the output slot."""
+    # Applying the configured steps to a tiny non-square index image identifies the combined op
+    probe = np.arange(6, dtype=np.uint8).reshape(2, 3)
+    expected = probe if transform.rotate_code is None else cv2.rotate(probe, transform.rotate_code)
+    if transform.flip_horizontal:
+        expected = cv2.flip(expected, 1)
+    if transform.flip_vertical:
+        expected = cv2.flip(expected, 0)
+
+    for op in _PLANE_OPS:
+        if np.array_equal(op(probe, None), expected):
+            return op
+    raise ValueError(f"unsupported frame transform: {transform}")
 
 
 class CameraManager:
@@ -314,15 +691,16 @@ class CameraManager:
         return stream.is_running
 
     def status_snapshot(self) -> Dict[str, dict]:
-        with self._lock:
-            return {
-                camera_id: {
-                    "config": stream.config,
-                    "is_running": stream.is_running,
-                    "timestamp": stream.get_timestamp(),
-                }
-                for camera_id, stream in self._streams.items()
+        # Every field is a single atomic read, so polling never waits on ensure_started, which
+        # holds the lock while a camera opens
+        return {
+            camera_id: {
+                "config": stream.config,
+                "is_running": stream.is_running,
+                "timestamp": stream.get_timestamp(),
             }
+            for camera_id, stream in self._streams.items()
+        }
 
     def ensure_started(self, camera_id: str) -> bool:
         stream = self._streams.get(camera_id)
@@ -352,12 +730,72 @@ class CameraManager:
             return None
         return stream.get_frame()
 
+    def add_consumer(self, camera_id: str) -> None:
+        stream = self._streams.get(camera_id)
+        if stream is not None:
+            stream.add_consumer()
+
+    def remove_consumer(self, camera_id: str) -> None:
+        stream = self._streams.get(camera_id)
+        if stream is not None:
+            stream.remove_consumer()
+
+    def needs_pixels(self, camera_id: str) -> bool:
+        stream = self._streams.get(camera_id)
+        if stream is None:
+            return False
+        return stream.needs_pixels()
+
+    def get_frame_view(self, camera_id: str, min_timestamp: Optional[float] = None) -> Optional[np.ndarray]:
+        stream = self._streams.get(camera_id)
+        if stream is None:
+            return None
+        return stream.get_frame_view(min_timestamp)
+
+    def get_frames(self, camera_ids: Iterable[str]) -> Dict[str, Optional[np.ndarray]]:
+        """Read-only views of several cameras' newest frames, taken back to back without locking."""
+        frames: Dict[str, Optional[np.ndarray]] = {}
+        for camera_id in camera_ids:
+            stream = self._streams.get(camera_id)
+            frames[camera_id] = stream.get_frame_view() if stream is not None else None
+        return frames
+
+    def attach_ring(self, camera_id: str, ring: FrameRing) -> bool:
+        stream = self._streams.get(camera_id)
+        if stream is None:
+            return False
+        stream.attach_ring(ring)
+        return True
+
+    def detach_ring(self, camera_id: str, ring: FrameRing) -> None:
+        stream = self._streams.get(camera_id)
+        if stream is not None:
+            stream.detach_ring(ring)
+
     def get_timestamp(self, camera_id: str) -> float:
         stream = self._streams.get(camera_id)
         if stream is None:
             return 0.0
         return stream.get_timestamp()
 
+    def subscribe(
+        self,
+        camera_id: str,
+        loop: asyncio.AbstractEventLoop,
+        width: Optional[int] = None,
+        raw: bool = False,
+        max_fps: Optional[float] = None,
+    ) -> Optional[FrameSubscription]:
+        stream = self._streams.get(camera_id)
+        if stream is None:
+            return None
+        return stream.subscribe(loop, width, raw, max_fps)
+
+    def unsubscribe(self, camera_id: str, subscription: FrameSubscription) -> None:
+        stream = self._streams.get(camera_id)
+        if stream is not None:
+            stream.unsubscribe(subscription)
+
 
 def build_default_camera_manager() -> CameraManager:
     transform_infrared = FrameTransform(rotate_code=cv2.ROTATE_90_CLOCKWISE)
@@ -371,14 +809,12 @@ def _discover_camera_configs(
     transform_infrared: FrameTransform,
     transform_world: FrameTransform,
 ) -> list[CameraConfig]:
-    try:
-        import uvc
-    except ImportError:
+    if _uvc is None:
         LOGGER.warning("pyuvc 未安装，将回退到 OpenCV 设备索引")
         return _fallback_opencv_configs(transform_infrared, transform_world)
 
     try:
-        devices = uvc.device_list()
+        devices = _uvc.device_list()
     except Exception as exc:  # noqa: BLE001
         LOGGER.warning("枚举 UVC 设备失败，将回退到 OpenCV，错误：%s", exc)
         return _fallback_opencv_configs(transform_infrared, transform_world)
@@ -421,6 +857,7 @@ def _discover_camera_configs(
                 fourcc="MJPG",
                 transform=transform_infrared,
                 access_method="libuvc",
+                pixel_format="gray",
                 vendor_id=dev.get("idVendor"),
                 product_id=dev.get("idProduct"),
                 device_uid=dev.get("uid"),
@@ -479,6 +916,7 @@ def _fallback_opencv_configs(
             fourcc="MJPG",
             transform=transform_infrared,
             access_method="opencv",
+            pixel_format="gray",
         ),
         CameraConfig(
             camera_id="eye1",
@@ -489,6 +927,7 @@ def _fallback_opencv_configs(
             fourcc="MJPG",
             transform=transform_infrared,
             access_method="opencv",
+            pixel_format="gray",
         ),
         CameraConfig(
             camera_id="world",
@@ -2,14 +2,14 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FrameTransform:
     rotate_code: Optional[int] = None
     flip_horizontal: bool = False
     flip_vertical: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CameraConfig:
     camera_id: str
     device_index: int
@@ -21,9 +21,26 @@ class CameraConfig:
     fourcc: Optional[str] = None
     transform: FrameTransform = field(default_factory=FrameTransform)
     access_method: str = "opencv"
+    # "bgr" or "gray"; gray cameras keep single-plane frames from capture through recording
+    pixel_format: str = "bgr"
     vendor_id: Optional[int] = None
     product_id: Optional[int] = None
     serial_number: Optional[str] = None
     device_uid: Optional[str] = None
     device_address: Optional[int] = None
+    # Opt-in: grab() past frames the backend queued despite CAP_PROP_BUFFERSIZE (OpenCV only)
+    drain_stale: bool = False
 
+
+@dataclass(frozen=True)
+class EncodedFrame:
+    seq: int
+    part: bytes
+    shape: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class RawFrame:
+    seq: int
+    data: bytes
+    shape: tuple[int, ...]
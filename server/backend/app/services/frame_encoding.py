@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import logging
+from typing import Optional, Union
+
+import cv2
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+JPEG_QUALITY = 80
+MJPEG_BOUNDARY = "frame"
+MJPEG_MEDIA_TYPE = f"multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}"
+
+_PART_PREFIX = b"--" + MJPEG_BOUNDARY.encode() + b"\r\nContent-Type: image/jpeg\r\nContent-Length: "
+_PART_SUFFIX = b"\r\n"
+
+# TurboJPEG hands back ``bytes``; the OpenCV path exposes its output array without copying it
+JpegPayload = Union[bytes, memoryview]
+
+try:
+    from turbojpeg import TJPF_BGR, TJPF_GRAY, TJSAMP_420, TJSAMP_GRAY, TurboJPEG
+except ImportError:
+    _turbojpeg = None
+else:
+    try:
+        _turbojpeg = TurboJPEG()
+    except (OSError, RuntimeError) as exc:
+        LOGGER.warning("libturbojpeg 加载失败，回退到 OpenCV 编码: %s", exc)
+        _turbojpeg = None
+
+
+def encode_jpeg(frame: np.ndarray, quality: int = JPEG_QUALITY) -> Optional[JpegPayload]:
+    """Encode a BGR or grayscale frame, preferring libjpeg-turbo when available."""
+    if _turbojpeg is not None:
+        if frame.ndim == 2:
+            pixel_format, subsample = TJPF_GRAY, TJSAMP_GRAY
+        else:
+            pixel_format, subsample = TJPF_BGR, TJSAMP_420
+        try:
+            return _turbojpeg.encode(frame, quality=quality, pixel_format=pixel_format, jpeg_subsample=subsample)
+        except OSError:
+            LOGGER.debug("TurboJPEG 编码失败，回退到 OpenCV", exc_info=True)
+
+    success, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not success:
+        return None
+    return memoryview(encoded).cast("B")
+
+
+def mjpeg_part(payload: JpegPayload) -> bytes:
+    """Build one complete multipart chunk (boundary, headers, JPEG, trailer).
+
+    Streams yield it whole, so each frame is a single ASGI body message and a single socket write;
+    asyncio and uvloop already enable ``TCP_NODELAY`` on accepted connections, so it is not held back.
+    """
+    # Single copy of the JPEG into the part that every subscriber at this width shares
+    return b"".join((_PART_PREFIX, b"%d\r\n\r\n" % len(payload), payload, _PART_SUFFIX))
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Optional
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+# Slots the consumer leaves between itself and the producer, so a popped view survives at least
+# this many further pushes before its slot is overwritten
+RING_SAFETY_MARGIN = 2
+
+
+class FrameRing:
+    """Bounded single-producer/single-consumer queue of preallocated frame slots.
+
+    The capture thread is the only writer of ``_head``, the slots and ``rejected``; the consumer
+    is the only writer of ``_tail`` and ``dropped``. Each side does single attribute stores, so no lock is
+    needed. The producer never waits: once the consumer falls behind, the oldest frames are
+    overwritten and the consumer counts them as dropped when it catches up. ``wakeup``, if given,
+    is set after every push so a consumer draining several rings can sleep on one event.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        dtype: np.dtype = np.uint8,
+        capacity: int = 6,
+        wakeup: Optional[threading.Event] = None,
+    ) -> None:
+        if capacity <= RING_SAFETY_MARGIN:
+            raise ValueError(f"capacity must exceed {RING_SAFETY_MARGIN}")
+        self.shape = tuple(shape)
+        self.capacity = capacity
+        self.dropped = 0
+        # Frames refused because their shape no longer fits the slots (e.g. a resolution change)
+        self.rejected = 0
+        self._slots = np.empty((capacity, *self.shape), dtype=dtype)
+        # Read-only views are made once per slot, so pop() hands them out without allocating
+        self._views = tuple(self._read_only(slot) for slot in self._slots)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._head = 0
+        self._tail = 0
+        self._wakeup = wakeup
+
+    def push(self, frame: np.ndarray, timestamp: float) -> bool:
+        """Copy ``frame`` into the next slot; returns False (and counts it) if its shape does not fit."""
+        if frame.shape != self.shape:
+            if not self.rejected:
+                LOGGER.warning("帧尺寸 %s 与录制缓冲 %s 不一致，后续帧将被丢弃", frame.shape, self.shape)
+            self.rejected += 1
+            return False
+
+        head = self._head
+        index = head % self.capacity
+        np.copyto(self._slots[index], frame)
+        self._timestamps[index] = timestamp
+        # Publish only after the slot is complete
+        self._head = head + 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    def pop(self) -> Optional[tuple[np.ndarray, float]]:
+        """Return a read-only view of the oldest safe frame and its timestamp, or None if empty."""
+        head = self._head
+        tail = self._tail
+        if tail >= head:
+            return None
+
+        oldest_safe = head - self.capacity + RING_SAFETY_MARGIN
+        if tail < oldest_safe:
+            self.dropped += oldest_safe - tail
+            tail = oldest_safe
+
+        index = tail % self.capacity
+        timestamp = float(self._timestamps[index])
+        self._tail = tail + 1
+        return self._views[index], timestamp
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+    @staticmethod
+    def _read_only(slot: np.ndarray) -> np.ndarray:
+        view = slot.view()
+        view.flags.writeable = False
+        return view
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import shutil
+from typing import AsyncIterator, Optional
+
+from .camera_manager import FrameSubscription
+from .camera_types import RawFrame
+
+LOGGER = logging.getLogger(__name__)
+
+MP4_MEDIA_TYPE = "video/mp4"
+H264_BITRATE = "2M"
+_READ_CHUNK = 64 * 1024
+
+
+def find_ffmpeg() -> Optional[str]:
+    return shutil.which("ffmpeg")
+
+
+def build_ffmpeg_command(ffmpeg: str, shape: tuple[int, ...], fps: float, bitrate: str = H264_BITRATE) -> list[str]:
+    """Raw BGR/GRAY frames on stdin -> low-latency fragmented MP4 (H.264) on stdout."""
+    height, width = shape[:2]
+    pix_fmt = "gray" if len(shape) == 2 else "bgr24"
+    return [
+        ffmpeg,
+        "-hide_banner",
+        "-loglevel", "error",
+        "-f", "rawvideo",
+        "-pix_fmt", pix_fmt,
+        "-s", f"{width}x{height}",
+        "-r", f"{fps:g}",
+        "-i", "pipe:0",
+        "-an",
+        "-c:v", "libx264",
+        "-preset", "ultrafast",
+        "-tune", "zerolatency",
+        "-g", "9999",
+        "-bf", "0",
+        "-b:v", bitrate,
+        "-maxrate", bitrate,
+        "-bufsize", bitrate,
+        "-x264-params", "nal-hrd=cbr:force-cfr=1",
+        "-pix_fmt", "yuv420p",
+        "-f", "mp4",
+        "-movflags", "empty_moov+default_base_moof+frag_every_frame",
+        "pipe:1",
+    ]
+
+
+async def iter_h264(
+    process: asyncio.subprocess.Process,
+    subscription: FrameSubscription,
+    first: RawFrame,
+) -> AsyncIterator[bytes]:
+    assert process.stdin is not None and process.stdout is not None
+    stdin, stdout = process.stdin, process.stdout
+
+    async def feed() -> None:
+        frame = first
+        try:
+            # ffmpeg was configured for the first frame's geometry; stop if the camera changes mode
+            while frame.shape == first.shape:
+                stdin.write(frame.data)
+                await stdin.drain()
+                frame = await subscription.get()
+        except (BrokenPipeError, ConnectionResetError):
+            LOGGER.debug("ffmpeg 输入管道已关闭")
+        finally:
+            stdin.close()
+
+    feeder = asyncio.create_task(feed())
+    try:
+        while True:
+            chunk = await stdout.read(_READ_CHUNK)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        feeder.cancel()
+        if process.returncode is None:
+            process.kill()
+        await process.wait()
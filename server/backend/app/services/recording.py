@@ -1,18 +1,38 @@
 from __future__ import annotations
 
+import functools
 import logging
+import os
+import re
+import shutil
+import subprocess
 import threading
-import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Iterable, Optional
 
 import cv2
+
 from .camera_manager import CameraManager
+from .frame_ring import FrameRing
 
 LOGGER = logging.getLogger(__name__)
 
+# GStreamer H.264 encoders in preference order (Jetson, Intel VA-API, Raspberry Pi), each with the
+# conversion its sink pad expects
+_HW_ENCODERS = (
+    (
+        "nvv4l2h264enc",
+        "videoconvert ! video/x-raw,format=BGRx ! nvvidconv ! video/x-raw(memory:NVMM),format=I420 ! nvv4l2h264enc",
+    ),
+    ("vaapih264enc", "videoconvert ! video/x-raw,format=NV12 ! vaapih264enc"),
+    ("v4l2h264enc", "videoconvert ! video/x-raw,format=I420 ! v4l2h264enc"),
+)
+
+# Upper bound on a writer's wait when its camera stops delivering frames
+WAKEUP_TIMEOUT = 0.5
+
 
 def create_record_directory(base_dir: Path) -> Path:
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -21,10 +41,42 @@ def create_record_directory(base_dir: Path) -> Path:
     return target
 
 
+@functools.lru_cache(maxsize=1)
+def hardware_encoder_pipeline() -> Optional[str]:
+    """Return the GStreamer encode fragment for the first usable hardware H.264 encoder, if any."""
+    if os.getenv("RECORDING_HW_ENCODER") == "0":
+        return None
+    if not re.search(r"GStreamer:\s*YES", cv2.getBuildInformation()):
+        return None
+
+    inspect = shutil.which("gst-inspect-1.0")
+    if inspect is None:
+        return None
+
+    for element, fragment in _HW_ENCODERS:
+        try:
+            result = subprocess.run(
+                [inspect, element],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5.0,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if result.returncode == 0:
+            LOGGER.info("录制将使用硬件编码器 %s", element)
+            return fragment
+    return None
+
+
 @dataclass
 class RecordingTarget:
     camera_id: str
     video_writer: cv2.VideoWriter
+    ring: FrameRing
+    wakeup: threading.Event = field(default_factory=threading.Event)
+    thread: Optional[threading.Thread] = None
 
 
 class RecordingSession:
@@ -33,7 +85,7 @@ class RecordingSession:
         camera_manager: CameraManager,
         record_dir: Path,
         camera_ids: Iterable[str],
-        fps: float = 30.0,
+        fps: Optional[float] = None,
         fourcc: str = "mp4v",
     ) -> None:
         self._camera_manager = camera_manager
@@ -43,7 +95,6 @@ class RecordingSession:
         self._fourcc = cv2.VideoWriter_fourcc(*fourcc)
 
         self._targets: Dict[str, RecordingTarget] = {}
-        self._thread: Optional[threading.Thread] = None
         self._running = threading.Event()
 
     def start(self) -> bool:
@@ -56,8 +107,15 @@ class RecordingSession:
             return False
 
         self._running.set()
-        self._thread = threading.Thread(target=self._record_loop, daemon=True)
-        self._thread.start()
+        # One writer thread per camera: VideoWriter.write encodes synchronously, so cameras would
+        # otherwise queue behind each other's encodes
+        for camera_id, target in self._targets.items():
+            self._camera_manager.add_consumer(camera_id)
+            self._camera_manager.attach_ring(camera_id, target.ring)
+            target.thread = threading.Thread(
+                target=self._write_loop, args=(target,), name=f"record-{camera_id}", daemon=True
+            )
+            target.thread.start()
         LOGGER.info("Recording session started at %s", self._record_dir)
         return True
 
@@ -66,11 +124,25 @@ class RecordingSession:
             return
 
         self._running.clear()
-        if self._thread is not None:
-            self._thread.join(timeout=2.0)
-            self._thread = None
-
-        self._release_targets()
+        for target in self._targets.values():
+            target.wakeup.set()
+        for camera_id, target in self._targets.items():
+            if target.thread is not None:
+                target.thread.join(timeout=2.0)
+                if target.thread.is_alive():
+                    # Still inside write(); the thread releases its own writer once that returns
+                    LOGGER.warning("录制 %s 的写入线程未在超时内退出，将在当前帧写完后自行释放", camera_id)
+                target.thread = None
+
+        for camera_id, target in self._targets.items():
+            self._camera_manager.detach_ring(camera_id, target.ring)
+            self._camera_manager.remove_consumer(camera_id)
+            if target.ring.dropped:
+                LOGGER.warning("录制 %s 时丢弃了 %d 帧（写入跟不上采集）", camera_id, target.ring.dropped)
+            if target.ring.rejected:
+                LOGGER.warning("录制 %s 时丢弃了 %d 帧（帧尺寸与录制开始时不一致）", camera_id, target.ring.rejected)
+        # Writers were released by their own threads as _write_loop returned
+        self._targets.clear()
         LOGGER.info("Recording session stopped")
 
     @property
@@ -81,47 +153,76 @@ class RecordingSession:
     def record_dir(self) -> Path:
         return self._record_dir
 
+    @property
+    def dropped_frames(self) -> Dict[str, int]:
+        """Frames each camera's file is missing, from writer overruns or frames whose shape changed."""
+        return {
+            camera_id: target.ring.dropped + target.ring.rejected
+            for camera_id, target in self._targets.items()
+        }
+
     def _prepare_targets(self) -> bool:
         for camera_id in self._camera_ids:
-            frame = self._camera_manager.get_frame(camera_id)
+            frame = self._camera_manager.get_frame_view(camera_id)
             if frame is None:
                 LOGGER.error("Cannot initialize recording; camera %s has no frame", camera_id)
                 return False
 
+            # Every captured frame is written, so the container rate must match the camera's
+            config = self._camera_manager.get_config(camera_id)
+            fps = self._fps or (config.fps if config is not None else 30.0)
             height, width = frame.shape[:2]
             video_path = self._record_dir / f"{camera_id}.mp4"
-            writer = cv2.VideoWriter(str(video_path), self._fourcc, self._fps, (width, height))
+            # Gray cameras are written as single-plane video rather than expanded to BGR per frame
+            writer = self._open_writer(video_path, fps, (width, height), is_color=frame.ndim == 3)
             if not writer.isOpened():
                 LOGGER.error("Failed to open video writer for %s", video_path)
                 return False
 
-            self._targets[camera_id] = RecordingTarget(camera_id=camera_id, video_writer=writer)
+            wakeup = threading.Event()
+            ring = FrameRing(frame.shape, frame.dtype, wakeup=wakeup)
+            self._targets[camera_id] = RecordingTarget(
+                camera_id=camera_id, video_writer=writer, ring=ring, wakeup=wakeup
+            )
 
         return True
 
-    def _record_loop(self) -> None:
-        interval = 1.0 / self._fps
-        next_tick = time.perf_counter()
-
-        while self._running.is_set():
-            now = time.perf_counter()
-            if now < next_tick:
-                time.sleep(next_tick - now)
-
-            for camera_id, target in list(self._targets.items()):
-                frame = self._camera_manager.get_frame(camera_id)
-                if frame is None:
-                    LOGGER.warning("Skipping frame for %s; no data", camera_id)
-                    continue
-
-                if frame.ndim == 2:
-                    frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-
-                target.video_writer.write(frame)
-
-            next_tick = max(next_tick + interval, time.perf_counter())
+    def _open_writer(
+        self,
+        video_path: Path,
+        fps: float,
+        size: tuple[int, int],
+        is_color: bool = True,
+    ) -> cv2.VideoWriter:
+        fragment = hardware_encoder_pipeline()
+        if fragment is not None:
+            pipeline = f'appsrc ! {fragment} ! h264parse ! mp4mux ! filesink location="{video_path}"'
+            writer = cv2.VideoWriter(pipeline, cv2.CAP_GSTREAMER, 0, fps, size, is_color)
+            if writer.isOpened():
+                return writer
+            writer.release()
+            LOGGER.warning("硬件编码管线无法打开，%s 回退到软件编码", video_path.name)
+
+        return cv2.VideoWriter(str(video_path), self._fourcc, fps, size, is_color)
+
+    def _write_loop(self, target: RecordingTarget) -> None:
+        try:
+            while self._running.is_set():
+                # The producer sets the event after each push; clearing before draining never loses one
+                target.wakeup.wait(WAKEUP_TIMEOUT)
+                target.wakeup.clear()
+                # Drain in capture order; write() encodes synchronously, so the slot view stays valid
+                while True:
+                    item = target.ring.pop()
+                    if item is None:
+                        break
+                    target.video_writer.write(item[0])
+        finally:
+            # Only this thread ever calls write(), so releasing here can never race an encode
+            target.video_writer.release()
 
     def _release_targets(self) -> None:
+        # Only for targets whose writer thread never started
         for target in self._targets.values():
             target.video_writer.release()
         self._targets.clear()
@@ -144,6 +245,13 @@ class RecordingManager:
             return None
         return self._current_session._record_dir
 
+    @property
+    def dropped_frames(self) -> Dict[str, int]:
+        session = self._current_session
+        if session is None:
+            return {}
+        return session.dropped_frames
+
     def start(self, camera_ids: Iterable[str]) -> Optional[Path]:
         with self._lock:
             if self.active:
@@ -1,15 +1,39 @@
 from __future__ import annotations
 
+import ctypes
+import logging
 import os
 import platform
 import re
 import shutil
+import signal
 import socket
+import struct
 import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, Optional, Sequence
+from typing import Any, Callable, Iterable, Optional, Sequence, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts
+    fcntl = None
+
+try:
+    import serial
+except ImportError:
+    serial = None
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 
 @dataclass(slots=True)
@@ -23,52 +47,137 @@ class DeviceStatus:
     gps_raw_sentences: list[str] = field(default_factory=list)
 
 
-def _read_sysfs_battery() -> Optional[str]:
-    base = Path("/sys/class/power_supply")
-    if not base.exists():
+POWER_SUPPLY_DIR = Path("/sys/class/power_supply")
+
+
+@lru_cache(maxsize=None)
+def _which_cached(name: str) -> Optional[str]:
+    # Probe binaries are installed or not for the life of the process; skip the PATH walk per poll
+    return shutil.which(name)
+
+
+# Applies to the short battery queries, which previously had no timeout at all
+PROBE_COMMAND_TIMEOUT = 2.0
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    # Probes run in their own session, so this also takes out any helpers they forked
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _run_probe_command(cmd: Sequence[str], timeout: float, check: bool = True) -> Optional[str]:
+    """Run ``cmd`` and return its stdout, or None if it cannot start, times out or (with ``check``) fails.
+
+    A timed-out command is SIGKILLed together with its process group, so a child that ignores
+    SIGTERM or keeps the pipe open cannot hold a probe thread past ``timeout``.
+    """
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            start_new_session=True,
+        )
+    except OSError:
         return None
 
-    for entry in base.iterdir():
+    with proc:
         try:
-            power_type = (entry / "type").read_text().strip().lower()
-        except OSError:
-            continue
+            output, _ = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_process_group(proc)
+            proc.communicate()
+            return None
+    if check and proc.returncode != 0:
+        return None
+    return output
+
+
+@lru_cache(maxsize=1)
+def _has_power_supply_dir() -> bool:
+    return POWER_SUPPLY_DIR.is_dir()
+
+
+def _read_sysfs_battery() -> Optional[str]:
+    if not _has_power_supply_dir():
+        return None
+
+    try:
+        entries = list(os.scandir(POWER_SUPPLY_DIR))
+    except OSError:
+        return None
 
-        if power_type not in {"battery", "ups"}:
+    for entry in entries:
+        power_type = _read_small(os.path.join(entry.path, "type"))
+        if power_type is None or power_type.strip().lower() not in (b"battery", b"ups"):
             continue
 
-        capacity_file = entry / "capacity"
-        if capacity_file.exists():
-            value = _read_int(capacity_file)
-            if value is not None:
-                return f"{value}%"
+        value = _read_int(os.path.join(entry.path, "capacity"))
+        if value is not None:
+            return f"{value}%"
 
         # Some boards expose charge/energy information instead of capacity
-        current_file = _first_existing(entry, ["charge_now", "energy_now"])
-        full_file = _first_existing(entry, ["charge_full", "energy_full"])
-        if current_file and full_file:
-            current = _read_int(current_file)
-            full = _read_int(full_file)
-            if current is not None and full and full > 0:
-                percentage = int((current / full) * 100)
-                percentage = max(0, min(percentage, 100))
-                return f"{percentage}%"
-
-        voltage_file = entry / "capacity_level"
-        if voltage_file.exists():
-            try:
-                level = voltage_file.read_text().strip()
-                if level:
-                    return level
-            except OSError:
-                continue
+        current = _read_first_int(entry.path, ("charge_now", "energy_now"))
+        full = _read_first_int(entry.path, ("charge_full", "energy_full"))
+        if current is not None and full and full > 0:
+            percentage = max(0, min((current * 100) // full, 100))
+            return f"{percentage}%"
+
+        level = _read_small(os.path.join(entry.path, "capacity_level"))
+        if level and level.strip():
+            return level.strip().decode(errors="replace")
     return None
 
 
-def _read_pmset_battery() -> Optional[str]:
+IOKIT_PATH = "/System/Library/Frameworks/IOKit.framework/IOKit"
+
+
+def _load_iokit_percent_remaining() -> Optional[Any]:
+    if sys.platform != "darwin":
+        return None
     try:
-        output = subprocess.check_output(["pmset", "-g", "batt"], text=True)
-    except (FileNotFoundError, subprocess.CalledProcessError):
+        iokit = ctypes.cdll.LoadLibrary(IOKIT_PATH)
+        func = iokit.IOPSGetPercentRemaining
+    except (OSError, AttributeError):
+        return None
+    # IOReturn IOPSGetPercentRemaining(int *percent, bool *isCharging, bool *isFullyCharged)
+    func.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_bool), ctypes.POINTER(ctypes.c_bool)]
+    func.restype = ctypes.c_int
+    return func
+
+
+# Resolved once at import; None off macOS or when the symbol is missing
+_IOPS_GET_PERCENT_REMAINING = _load_iokit_percent_remaining()
+
+
+def _read_iokit_battery() -> Optional[str]:
+    """Read the battery level straight from IOKit, sparing the pmset fork/exec on macOS."""
+    func = _IOPS_GET_PERCENT_REMAINING
+    if func is None:
+        return None
+
+    percent = ctypes.c_int()
+    charging = ctypes.c_bool()
+    full = ctypes.c_bool()
+    # Anything but kIOReturnSuccess (e.g. no internal battery) defers to pmset
+    if func(ctypes.byref(percent), ctypes.byref(charging), ctypes.byref(full)) != 0:
+        return None
+    if 0 <= percent.value <= 100:
+        return f"{percent.value}%"
+    return None
+
+
+def _read_pmset_battery() -> Optional[str]:
+    pmset = _which_cached("pmset")
+    if not pmset:
+        return None
+
+    output = _run_probe_command([pmset, "-g", "batt"], PROBE_COMMAND_TIMEOUT)
+    if output is None:
         return None
 
     for line in output.splitlines():
@@ -83,15 +192,68 @@ def _read_pmset_battery() -> Optional[str]:
     return None
 
 
-def _get_ip_address() -> str:
+PROC_NET_ROUTE = "/proc/net/route"
+SIOCGIFADDR = 0x8915
+IP_ADDRESS_TTL = 30.0
+
+_IP_CACHE: Optional[tuple[float, str]] = None
+
+
+def _default_route_interface() -> Optional[str]:
+    try:
+        with open(PROC_NET_ROUTE) as routes:
+            next(routes, None)
+            for line in routes:
+                fields = line.split()
+                # Destination 00000000 is the default route
+                if len(fields) > 1 and fields[1] == "00000000":
+                    return fields[0]
+    except OSError:
+        return None
+    return None
+
+
+def _interface_ipv4(interface: str) -> Optional[str]:
+    if fcntl is None:
+        return None
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            request = struct.pack("256s", interface[:15].encode())
+            response = fcntl.ioctl(s.fileno(), SIOCGIFADDR, request)
+    except OSError:
+        return None
+    return socket.inet_ntoa(response[20:24])
+
+
+def _route_ip_address() -> Optional[str]:
+    # Asking the kernel which source address it would use for a public destination; works on
+    # hosts without /proc, at the cost of a route lookup
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
             s.connect(("8.8.8.8", 80))
             return s.getsockname()[0]
     except OSError:
+        return None
+
+
+def _get_ip_address() -> str:
+    global _IP_CACHE
+    cached = _IP_CACHE
+    if cached is not None and time.monotonic() - cached[0] < IP_ADDRESS_TTL:
+        return cached[1]
+
+    interface = _default_route_interface()
+    address = _interface_ipv4(interface) if interface else None
+    if address is None:
+        address = _route_ip_address()
+    if address is None:
         return "未知"
 
+    _IP_CACHE = (time.monotonic(), address)
+    return address
+
 
+@lru_cache(maxsize=1)
 def _get_hostname() -> str:
     try:
         return socket.gethostname()
@@ -100,7 +262,7 @@ def _get_hostname() -> str:
 
 
 def _get_battery_percentage() -> str:
-    for getter in (_read_sysfs_battery, _read_pmset_battery):
+    for getter in (_read_sysfs_battery, _read_iokit_battery, _read_pmset_battery):
         value = getter()
         if value:
             return value
@@ -112,43 +274,121 @@ def _get_battery_percentage() -> str:
     return "未知"
 
 
+# The probes block on subprocesses and sockets, so they run side by side instead of back to back
+_PROBE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="devstat")
+# Extra time allowed past a probe's own subprocess timeout before its result is abandoned
+PROBE_GRACE_SECONDS = 1.0
+
+_STATUS_CACHE: Optional[tuple[float, DeviceStatus]] = None
+_STATUS_LOCK = threading.Lock()
+
+
 def get_device_status() -> DeviceStatus:
-    hardware_items = _collect_hardinfo_summary()
-    gps_items, gps_raw = _collect_gps_info()
+    """Return the latest device status, re-probing at most once per ``DEVICE_STATUS_TTL`` seconds.
+
+    Concurrent callers that miss the cache wait on one refresh instead of each spawning the probes.
+    The returned object is shared between callers and must be treated as read-only.
+    """
+    global _STATUS_CACHE
+    ttl = _STATUS_CONFIG.ttl
+    cached = _STATUS_CACHE
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    with _STATUS_LOCK:
+        cached = _STATUS_CACHE
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        status = _collect_device_status()
+        _STATUS_CACHE = (time.monotonic(), status)
+        return status
+
+
+def _probe_result(future: Future[T], timeout: float, default: T) -> T:
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        LOGGER.warning("设备信息探测超时 (%.1fs)，本次跳过", timeout)
+    except Exception:
+        LOGGER.exception("设备信息探测失败")
+    return default
+
+
+def _collect_device_status() -> DeviceStatus:
+    hardinfo_future = _PROBE_POOL.submit(_collect_hardinfo_summary)
+    gps_future = _PROBE_POOL.submit(_collect_gps_info)
+    battery_future = _PROBE_POOL.submit(_get_battery_percentage)
+    ip_future = _PROBE_POOL.submit(_get_ip_address)
+
+    # Futures are awaited one after another, but they all started together, so each budget
+    # below is an upper bound on that probe's total runtime rather than an extra wait
+    hardware_items = _probe_result(
+        hardinfo_future, _HARDINFO_CONFIG.timeout + PROBE_GRACE_SECONDS, []
+    )
+    gps_items, gps_raw = _probe_result(
+        gps_future, _GPS_CONFIG.timeout + 1.5 + PROBE_GRACE_SECONDS, ([], [])
+    )
+    battery = _probe_result(battery_future, 5.0, "未知")
+    ip_address = _probe_result(ip_future, PROBE_GRACE_SECONDS, "未知")
+
     return DeviceStatus(
         hostname=_get_hostname(),
-        ip_address=_get_ip_address(),
+        ip_address=ip_address,
         os_release=platform.platform(),
-        battery_percentage=_get_battery_percentage(),
+        battery_percentage=battery,
         hardware_items=hardware_items,
         gps_items=gps_items,
         gps_raw_sentences=gps_raw,
     )
 
 
-def _read_int(path: Path) -> Optional[int]:
+def _read_small(path: str) -> Optional[bytes]:
+    # sysfs attributes are a few bytes; one unbuffered read avoids the file object and decode
     try:
-        return int(path.read_text().strip())
-    except (OSError, ValueError):
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, 64)
+    except OSError:
         return None
+    finally:
+        os.close(fd)
 
 
-def _first_existing(base: Path, names: list[str]) -> Optional[Path]:
+def _read_int(path: str) -> Optional[int]:
+    data = _read_small(path)
+    if data is None:
+        return None
+    try:
+        return int(data)
+    except ValueError:
+        return None
+
+
+def _read_first_int(directory: str, names: Iterable[str]) -> Optional[int]:
     for name in names:
-        candidate = base / name
-        if candidate.exists():
-            return candidate
+        value = _read_int(os.path.join(directory, name))
+        if value is not None:
+            return value
     return None
 
 
+# Separate from _PROBE_POOL: the battery probe already runs there and would otherwise queue
+# its own per-device queries behind the other probes
+_UPOWER_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="upower")
+
+# One scan over the whole `upower -i` report instead of lowering and stripping every line
+_UPOWER_PERCENT_RE = re.compile(r"^\s*percentage:\s*(\d+)", re.MULTILINE | re.IGNORECASE)
+
+
 def _read_upower_battery() -> Optional[str]:
-    upower = shutil.which("upower")
+    upower = _which_cached("upower")
     if not upower:
         return None
 
-    try:
-        devices_output = subprocess.check_output([upower, "-e"], text=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    devices_output = _run_probe_command([upower, "-e"], PROBE_COMMAND_TIMEOUT)
+    if devices_output is None:
         return None
 
     battery_paths = [
@@ -159,22 +399,25 @@ def _read_upower_battery() -> Optional[str]:
     if not battery_paths:
         return None
 
-    for device_path in battery_paths:
-        try:
-            details = subprocess.check_output([upower, "-i", device_path], text=True)
-        except subprocess.CalledProcessError:
-            continue
+    # Query every battery at once, but keep upower's listing order as the preference order
+    futures = [
+        _UPOWER_POOL.submit(_run_probe_command, [upower, "-i", device_path], PROBE_COMMAND_TIMEOUT)
+        for device_path in battery_paths
+    ]
+    try:
+        for future in futures:
+            details = future.result()
+            if details is None:
+                continue
 
-        for line in details.splitlines():
-            line = line.strip().lower()
-            if line.startswith("percentage:"):
-                percent_str = line.split(":", 1)[1].strip().strip("% ")
-                try:
-                    value = int(percent_str)
-                    if 0 <= value <= 100:
-                        return f"{value}%"
-                except ValueError:
-                    continue
+            match = _UPOWER_PERCENT_RE.search(details)
+            if match:
+                value = int(match.group(1))
+                if 0 <= value <= 100:
+                    return f"{value}%"
+    finally:
+        for future in futures:
+            future.cancel()
     return None
 
 
@@ -203,67 +446,160 @@ HARDINFO_PRIORITY_KEYWORDS: tuple[str, ...] = (
     "battery",
 )
 
+_WHITESPACE_RE = re.compile(r"\s+")
+# One alternation scans a key for every priority keyword in a single pass
+_PRIORITY_RE = re.compile("|".join(re.escape(keyword) for keyword in HARDINFO_PRIORITY_KEYWORDS))
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True, slots=True)
+class _HardinfoConfig:
+    sections: tuple[str, ...]
+    summary_limit: int
+    allow_overflow: bool
+    timeout: float
+
+    @classmethod
+    def from_env(cls) -> "_HardinfoConfig":
+        sections_env = os.getenv("HARDINFO_SECTIONS")
+        if sections_env:
+            sections = tuple(section.strip() for section in sections_env.split(",") if section.strip())
+        else:
+            sections = HARDINFO_DEFAULT_SECTIONS
+        return cls(
+            sections=sections or ("devices.cpu",),
+            summary_limit=max(_env_int("HARDINFO_SUMMARY_LIMIT", 12), 1),
+            allow_overflow=bool(os.getenv("HARDINFO_ALLOW_OVERFLOW")),
+            timeout=_env_float("HARDINFO_TIMEOUT", 4.0),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _StatusConfig:
+    ttl: float
+
+    @classmethod
+    def from_env(cls) -> "_StatusConfig":
+        return cls(ttl=max(_env_float("DEVICE_STATUS_TTL", 3.0), 0.0))
+
+
+@dataclass(frozen=True, slots=True)
+class _GpsConfig:
+    sample_path: Optional[str]
+    device_path: str
+    skip_device_check: bool
+    baud: str
+    timeout: float
+
+    @classmethod
+    def from_env(cls) -> "_GpsConfig":
+        return cls(
+            sample_path=os.getenv("GPS_SAMPLE_FILE") or None,
+            device_path=os.getenv("GPS_SERIAL_DEVICE", "/dev/ttyUSB0"),
+            skip_device_check=os.getenv("GPS_SKIP_DEVICE_CHECK") == "1",
+            baud=os.getenv("GPS_SERIAL_BAUD", "9600"),
+            timeout=_env_float("GPS_READ_TIMEOUT", 3.0),
+        )
+
+
+# Environment is read once; the probes run on every cache miss and only need the parsed values
+_STATUS_CONFIG = _StatusConfig.from_env()
+_HARDINFO_CONFIG = _HardinfoConfig.from_env()
+_GPS_CONFIG = _GpsConfig.from_env()
+
+
+def refresh_config() -> None:
+    """Re-read the status/hardinfo/GPS environment variables and drop the cached device status."""
+    global _STATUS_CONFIG, _HARDINFO_CONFIG, _GPS_CONFIG, _STATUS_CACHE
+    _STATUS_CONFIG = _StatusConfig.from_env()
+    _HARDINFO_CONFIG = _HardinfoConfig.from_env()
+    _GPS_CONFIG = _GpsConfig.from_env()
+    with _STATUS_LOCK:
+        _STATUS_CACHE = None
+
 
 def _collect_hardinfo_summary() -> list[tuple[str, str]]:
-    binary = shutil.which("hardinfo")
+    binary = _which_cached("hardinfo")
     if not binary:
         return []
 
-    sections_env = os.getenv("HARDINFO_SECTIONS")
-    if sections_env:
-        sections = [section.strip() for section in sections_env.split(",") if section.strip()]
-    else:
-        sections = list(HARDINFO_DEFAULT_SECTIONS)
-
-    if not sections:
-        sections = ["devices.cpu"]
+    config = _HARDINFO_CONFIG
+    cmd = [binary, "-r", *config.sections]
+    limit = config.summary_limit
+    summary: list[tuple[str, str]] = []
+    seen: set[str] = set()
 
-    cmd = [binary, "-r", *sections]
     try:
-        output = subprocess.check_output(
+        proc = subprocess.Popen(
             cmd,
+            stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
             text=True,
-            timeout=float(os.getenv("HARDINFO_TIMEOUT", "4.0")),
+            start_new_session=True,
         )
-    except (OSError, subprocess.SubprocessError, ValueError):
+    except OSError:
         return []
 
-    limit = max(int(os.getenv("HARDINFO_SUMMARY_LIMIT", "12")), 1)
-    summary: list[tuple[str, str]] = []
-    seen: set[str] = set()
-
-    for raw_line in output.splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#") or line.startswith("="):
-            continue
-        if ":" not in line:
-            continue
+    # Output is parsed as it arrives, so the timeout has to be enforced out of band
+    killer = threading.Timer(config.timeout, _kill_process_group, args=(proc,))
+    killer.daemon = True
+    killer.start()
+    stopped_early = False
+    with proc:
+        try:
+            for raw_line in proc.stdout:
+                line = raw_line.strip()
+                if not line or line.startswith("#") or line.startswith("="):
+                    continue
+                if ":" not in line:
+                    continue
 
-        key, value = [part.strip(" \t:") for part in line.split(":", 1)]
-        if not key or not value:
-            continue
+                key, value = [part.strip(" \t:") for part in line.split(":", 1)]
+                if not key or not value:
+                    continue
 
-        normalized_key = re.sub(r"\s+", " ", key)
-        lower_key = normalized_key.lower()
-        if lower_key in seen:
-            continue
+                normalized_key = _WHITESPACE_RE.sub(" ", key)
+                lower_key = normalized_key.lower()
+                if lower_key in seen:
+                    continue
 
-        is_priority = any(keyword in lower_key for keyword in HARDINFO_PRIORITY_KEYWORDS)
-        if not is_priority and len(summary) >= limit:
-            continue
+                is_priority = _PRIORITY_RE.search(lower_key) is not None
+                if not is_priority and len(summary) >= limit:
+                    continue
 
-        summary.append((normalized_key, value.strip()))
-        seen.add(lower_key)
+                summary.append((normalized_key, value.strip()))
+                seen.add(lower_key)
 
-        if len(summary) >= limit and not os.getenv("HARDINFO_ALLOW_OVERFLOW"):
-            break
+                if len(summary) >= limit and not config.allow_overflow:
+                    # The rest of the report would be discarded; stop hardinfo instead of draining it
+                    stopped_early = True
+                    _kill_process_group(proc)
+                    break
+        finally:
+            killer.cancel()
 
+    # A timeout (killed by the timer) or a failing hardinfo yields nothing, as before
+    if not stopped_early and proc.returncode != 0:
+        return []
     return summary[:limit]
 
 
 def _collect_gps_info() -> tuple[list[tuple[str, str]], list[str]]:
-    sample_path = os.getenv("GPS_SAMPLE_FILE")
+    config = _GPS_CONFIG
+    sample_path = config.sample_path
     if sample_path:
         try:
             nmea_lines = [
@@ -274,42 +610,18 @@ def _collect_gps_info() -> tuple[list[tuple[str, str]], list[str]]:
         except OSError:
             nmea_lines = []
     else:
-        microcom_path = shutil.which("microcom")
-        if not microcom_path:
-            return ([], [])
-
-        device_path = os.getenv("GPS_SERIAL_DEVICE", "/dev/ttyUSB0")
-        skip_check = os.getenv("GPS_SKIP_DEVICE_CHECK") == "1"
-        if not skip_check and not Path(device_path).exists():
+        microcom_path = _which_cached("microcom")
+        if serial is None and not microcom_path:
             return ([], [])
 
-        baud = os.getenv("GPS_SERIAL_BAUD", "9600")
-
-        try:
-            timeout = float(os.getenv("GPS_READ_TIMEOUT", "3.0"))
-        except ValueError:
-            timeout = 3.0
-
-        timeout_ms = max(int(timeout * 1000), 500)
-        cmd = [microcom_path, "-s", str(baud), "-t", str(timeout_ms), device_path]
-
-        try:
-            completed = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=timeout + 1.5,
-                check=False,
-            )
-        except (OSError, subprocess.TimeoutExpired):
+        device_path = config.device_path
+        if not config.skip_device_check and not Path(device_path).exists():
             return ([], [])
 
-        nmea_lines = [
-            line.strip()
-            for line in completed.stdout.splitlines()
-            if line.strip()
-        ]
+        if serial is not None:
+            nmea_lines = _read_gps_serial(device_path, config.baud, config.timeout)
+        else:
+            nmea_lines = _read_gps_microcom(microcom_path, device_path, config.baud, config.timeout)
 
     if not nmea_lines:
         return ([], [])
@@ -322,36 +634,121 @@ def _collect_gps_info() -> tuple[list[tuple[str, str]], list[str]]:
         if sample_path:
             items.append(("数据源", f"样本文件：{Path(sample_path).name}"))
         else:
-            device_label = os.getenv("GPS_SERIAL_DEVICE", "/dev/ttyS0")
-            items.append(("串口", device_label))
+            items.append(("串口", config.device_path))
 
     raw_preview = sentences[-3:] if sentences else nmea_lines[-3:]
     return (items, raw_preview)
 
 
-def _parse_nmea_sentences(lines: Sequence[str]) -> dict[str, Any]:
-    data: dict[str, Any] = {}
-    gga_data: dict[str, Any] = {}
-    rmc_data: dict[str, Any] = {}
+# A receiver sends its sentences for one fix as a back-to-back burst; this much silence after
+# a complete line means the burst is over
+GPS_BURST_IDLE_SECONDS = 0.02
+GPS_POLL_INTERVAL = 0.005
+
+_GPS_PORT: Optional[Any] = None
+_GPS_PORT_LOCK = threading.Lock()
+
+
+def _open_gps_port(device_path: str, baud: str) -> Any:
+    global _GPS_PORT
+    port = _GPS_PORT
+    if port is not None and port.is_open and port.port == device_path and port.baudrate == int(baud):
+        return port
+    if port is not None:
+        port.close()
+    # Kept open between polls so each refresh skips the open and termios setup
+    _GPS_PORT = serial.Serial(device_path, baudrate=int(baud), timeout=0)
+    return _GPS_PORT
+
+
+def _read_nmea_burst(port: Any, timeout: float) -> bytes:
+    """Return the first complete burst that starts after ``port``'s input was discarded.
+
+    The reset can land mid-burst, and that tail often lacks the RMC/GGA sentences, so bytes are
+    dropped until the line has been idle for ``GPS_BURST_IDLE_SECONDS``; the next burst is then
+    collected until the line goes idle again.
+    """
+    port.reset_input_buffer()
+    buffer = bytearray()
+    deadline = time.monotonic() + timeout
+    # The reset counts as traffic, so the sync gap is measured from here
+    last_data = time.monotonic()
+    synced = False
+    while True:
+        now = time.monotonic()
+        chunk = port.read(4096)
+        if chunk:
+            if synced:
+                buffer += chunk
+            last_data = now
+        elif now - last_data > GPS_BURST_IDLE_SECONDS:
+            if not synced:
+                synced = True
+            elif b"\n" in buffer:
+                break
+        if now >= deadline:
+            break
+        if not chunk:
+            time.sleep(GPS_POLL_INTERVAL)
+    return bytes(buffer)
+
+
+def _read_gps_serial(device_path: str, baud: str, timeout: float) -> list[str]:
+    global _GPS_PORT
+    with _GPS_PORT_LOCK:
+        try:
+            port = _open_gps_port(device_path, baud)
+            data = _read_nmea_burst(port, timeout)
+        except (OSError, ValueError, serial.SerialException):
+            LOGGER.debug("GPS 串口读取失败: %s", device_path, exc_info=True)
+            if _GPS_PORT is not None:
+                _GPS_PORT.close()
+                _GPS_PORT = None
+            return []
+
+    text = data.decode("ascii", errors="ignore")
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def _read_gps_microcom(microcom_path: str, device_path: str, baud: str, timeout: float) -> list[str]:
+    timeout_ms = max(int(timeout * 1000), 500)
+    cmd = [microcom_path, "-s", str(baud), "-t", str(timeout_ms), device_path]
+
+    # microcom exits non-zero when its own -t timeout fires, so the exit status is not checked
+    output = _run_probe_command(cmd, timeout + 1.5, check=False)
+    if output is None:
+        return []
+
+    return [
+        line.strip()
+        for line in output.splitlines()
+        if line.strip()
+    ]
+
 
-    for line in lines:
-        sentence = line.split("*", 1)[0]
+def _parse_nmea_sentences(lines: Sequence[str]) -> dict[str, Any]:
+    # Only the newest valid fix of each type is kept, so walk backwards and stop once both are found
+    found: dict[str, dict[str, Any]] = {}
+    for line in reversed(lines):
+        sentence = line.partition("*")[0] if "*" in line else line
         parts = sentence.split(",")
-        if not parts or not parts[0]:
+        if not parts[0]:
+            continue
+
+        kind = parts[0][-3:].upper()
+        parser = _NMEA_PARSERS.get(kind)
+        if parser is None or kind in found:
             continue
 
-        talker = parts[0].upper()
-        if talker.endswith("RMC"):
-            parsed = _parse_rmc(parts)
-            if parsed:
-                rmc_data = parsed
-        elif talker.endswith("GGA"):
-            parsed = _parse_gga(parts)
-            if parsed:
-                gga_data = parsed
-
-    data.update(gga_data)
-    data.update(rmc_data)
+        parsed = parser(parts)
+        if parsed:
+            found[kind] = parsed
+            if len(found) == len(_NMEA_PARSERS):
+                break
+
+    data: dict[str, Any] = {}
+    data.update(found.get("GGA", {}))
+    data.update(found.get("RMC", {}))
     return data
 
 
@@ -420,28 +817,31 @@ def _parse_gga(parts: Sequence[str]) -> dict[str, Any]:
     return data
 
 
+_NMEA_PARSERS: dict[str, Callable[[Sequence[str]], dict[str, Any]]] = {"RMC": _parse_rmc, "GGA": _parse_gga}
+
+
+# Hemisphere -> (degree digits, sign): latitude is ddmm.mmmm, longitude dddmm.mmmm
+_NMEA_HEMISPHERES: dict[str, tuple[int, float]] = {
+    "N": (2, 1.0),
+    "S": (2, -1.0),
+    "E": (3, 1.0),
+    "W": (3, -1.0),
+}
+
+
 def _nmea_to_decimal(value: str, direction: str) -> Optional[float]:
+    hemisphere = _NMEA_HEMISPHERES.get(direction.strip().upper())
     value = value.strip()
-    direction = direction.strip().upper()
-    if not value or not direction:
+    if hemisphere is None or not value:
         return None
 
+    width, sign = hemisphere
     try:
-        if direction in {"N", "S"}:
-            degrees = int(value[:2])
-            minutes = float(value[2:])
-        elif direction in {"E", "W"}:
-            degrees = int(value[:3])
-            minutes = float(value[3:])
-        else:
-            return None
-    except (ValueError, IndexError):
+        degrees = int(value[:width])
+        minutes = float(value[width:])
+    except ValueError:
         return None
-
-    decimal = degrees + minutes / 60.0
-    if direction in {"S", "W"}:
-        decimal *= -1
-    return decimal
+    return sign * (degrees + minutes / 60.0)
 
 
 def _parse_nmea_datetime(time_str: str, date_str: str) -> Optional[str]:
@@ -454,10 +854,9 @@ def _parse_nmea_datetime(time_str: str, date_str: str) -> Optional[str]:
         hour = int(time_str[0:2])
         minute = int(time_str[2:4])
         second = int(time_str[4:6])
-        microsecond = 0
-        if "." in time_str:
-            fraction = time_str.split(".", 1)[1]
-            microsecond = int(float(f"0.{fraction}") * 1_000_000)
+        # Pad/truncate the fraction to microseconds as digits; going through float turns .29 into 289999
+        fraction = time_str.partition(".")[2]
+        microsecond = int(fraction[:6].ljust(6, "0")) if fraction else 0
 
         day = int(date_str[0:2])
         month = int(date_str[2:4])
@@ -483,31 +882,19 @@ def _safe_int(value: str) -> Optional[int]:
         return None
 
 
-def _gps_dict_to_items(data: dict[str, Any]) -> list[tuple[str, str]]:
-    if not data:
-        return []
-
-    items: list[tuple[str, str]] = []
-    mappings: list[tuple[str, str, Optional[str]]] = [
-        ("timestamp_utc", "UTC 时间", None),
-        ("latitude", "纬度", "{:.6f}°"),
-        ("longitude", "经度", "{:.6f}°"),
-        ("altitude_m", "海拔 (m)", "{:.1f}"),
-        ("speed_kmh", "速度 (km/h)", "{:.1f}"),
-        ("heading_deg", "航向 (°)", "{:.1f}"),
-        ("satellites", "卫星数量", None),
-        ("hdop", "HDOP", "{:.1f}"),
-        ("fix_quality", "定位质量", None),
-    ]
-
-    for key, label, fmt in mappings:
-        if key not in data or data[key] is None:
-            continue
-        value = data[key]
-        if fmt and isinstance(value, (int, float)):
-            items.append((label, fmt.format(value)))
-        else:
-            items.append((label, str(value)))
+# (key, label, formatter); the parsers always store floats for the formatted fields
+_GPS_FIELDS: tuple[tuple[str, str, Callable[[Any], str]], ...] = (
+    ("timestamp_utc", "UTC 时间", str),
+    ("latitude", "纬度", "{:.6f}°".format),
+    ("longitude", "经度", "{:.6f}°".format),
+    ("altitude_m", "海拔 (m)", "{:.1f}".format),
+    ("speed_kmh", "速度 (km/h)", "{:.1f}".format),
+    ("heading_deg", "航向 (°)", "{:.1f}".format),
+    ("satellites", "卫星数量", str),
+    ("hdop", "HDOP", "{:.1f}".format),
+    ("fix_quality", "定位质量", str),
+)
 
-    return items
 
+def _gps_dict_to_items(data: dict[str, Any]) -> list[tuple[str, str]]:
+    return [(label, fmt(data[key])) for key, label, fmt in _GPS_FIELDS if data.get(key) is not None]
@@ -0,0 +1,30 @@
+"""Production entrypoint: ``python server.py`` (run from ``server/backend``)."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+
+import uvicorn
+
+# Browsers poll the dashboard JSON every few seconds; keep those connections open between polls
+KEEPALIVE_TIMEOUT = 75
+
+
+def main() -> None:
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    uvicorn.run(
+        "app.main:app",
+        host=os.environ.get("SERVER_HOST", "0.0.0.0"),
+        port=int(os.environ.get("SERVER_PORT", "8000")),
+        loop=loop,
+        http=http,
+        timeout_keep_alive=KEEPALIVE_TIMEOUT,
+        # Cameras are opened by this process; extra workers would fight over the devices
+        workers=1,
+    )
+
+
+if __name__ == "__main__":
+    main()
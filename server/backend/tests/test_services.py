@@ -1,7 +1,22 @@
+import asyncio
+import itertools
+import subprocess
+import time
 from pathlib import Path
 
-from app.services.camera_manager import CameraConfig, CameraManager, build_default_camera_manager
+import cv2
+import numpy as np
+
+from app.services.algorithm_manager import AlgorithmManager, AlgorithmState
+from app.services.camera_manager import (
+    CameraConfig,
+    CameraManager,
+    CameraStream,
+    _compile_transform,
+    build_default_camera_manager,
+)
 from app.services.camera_types import FrameTransform
+from app.services.frame_ring import FrameRing
 from app.services.recording import RecordingManager
 from app.services import system_info
 
@@ -25,8 +40,9 @@ class DummyCameraManager(CameraManager):
     def ensure_started(self, camera_id: str) -> bool:
         return True
 
-    def get_frame(self, camera_id: str):
-        return None
+    def publish(self, frame: np.ndarray) -> None:
+        # Goes through the real slot, latest-frame and ring path that recording reads from
+        self._streams["dummy"]._publish_frame(frame)
 
 
 def test_recording_manager_start_fails_without_frames(tmp_path: Path):
@@ -38,6 +54,202 @@ def test_recording_manager_start_fails_without_frames(tmp_path: Path):
     assert not recording_manager.active
 
 
+def test_recording_writes_published_frames(tmp_path: Path):
+    manager = DummyCameraManager()
+    recording_manager = RecordingManager(base_dir=tmp_path, camera_manager=manager)
+    manager.publish(np.zeros((32, 32, 3), dtype=np.uint8))
+
+    record_dir = recording_manager.start(["dummy"])
+    assert record_dir is not None
+    for value in range(10):
+        manager.publish(np.full((32, 32, 3), value * 20, dtype=np.uint8))
+        time.sleep(0.02)
+    time.sleep(0.1)
+    assert recording_manager.dropped_frames == {"dummy": 0}
+    recording_manager.stop()
+
+    capture = cv2.VideoCapture(str(record_dir / "dummy.mp4"))
+    assert capture.get(cv2.CAP_PROP_FRAME_COUNT) == 10
+    capture.release()
+
+
+def test_frame_subscription_receives_encoded_frames():
+    stream = CameraStream(CameraConfig(camera_id="dummy", device_index=99, display_name="Dummy Cam"))
+
+    async def scenario():
+        subscription = stream.subscribe(asyncio.get_running_loop())
+        stream._publish_frame(np.zeros((8, 8, 3), dtype=np.uint8))
+        await asyncio.wait_for(subscription.get(), timeout=1.0)
+        stream._publish_frame(np.zeros((8, 8, 3), dtype=np.uint8))
+        encoded = await asyncio.wait_for(subscription.get(), timeout=1.0)
+        stream.unsubscribe(subscription)
+        return encoded
+
+    encoded = asyncio.run(scenario())
+    assert encoded.seq == 2
+    assert encoded.shape == (8, 8, 3)
+    assert encoded.part.startswith(b"--frame\r\nContent-Type: image/jpeg\r\n")
+
+
+def test_paced_subscription_skips_to_newest_frame():
+    stream = CameraStream(CameraConfig(camera_id="dummy", device_index=99, display_name="Dummy Cam"))
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        subscription = stream.subscribe(loop, raw=True, max_fps=20)
+        stream._publish_frame(np.zeros((4, 4, 3), dtype=np.uint8))
+        await asyncio.wait_for(subscription.get(), timeout=1.0)
+        started = loop.time()
+        for _ in range(3):
+            stream._publish_frame(np.zeros((4, 4, 3), dtype=np.uint8))
+            await asyncio.sleep(0.01)
+        frame = await asyncio.wait_for(subscription.get(), timeout=1.0)
+        return frame, loop.time() - started
+
+    frame, elapsed = asyncio.run(scenario())
+    assert frame.seq == 4
+    assert elapsed >= 0.04
+
+
+def test_frame_subscriptions_share_encode_per_width():
+    stream = CameraStream(CameraConfig(camera_id="dummy", device_index=99, display_name="Dummy Cam"))
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        full, small_a, small_b = stream.subscribe(loop), stream.subscribe(loop, 8), stream.subscribe(loop, 8)
+        stream._publish_frame(np.zeros((24, 32, 3), dtype=np.uint8))
+        return [await asyncio.wait_for(sub.get(), timeout=1.0) for sub in (full, small_a, small_b)]
+
+    full, small_a, small_b = asyncio.run(scenario())
+    assert small_a is small_b
+    assert full is not small_a
+
+    jpeg = small_a.part.split(b"\r\n\r\n", 1)[1]
+    decoded = cv2.imdecode(np.frombuffer(jpeg, dtype=np.uint8), cv2.IMREAD_COLOR)
+    assert decoded.shape == (6, 8, 3)
+
+
+def test_frame_view_is_read_only_slot():
+    config = CameraConfig(
+        camera_id="dummy",
+        device_index=99,
+        display_name="Dummy Cam",
+        transform=FrameTransform(rotate_code=cv2.ROTATE_90_CLOCKWISE),
+    )
+    stream = CameraStream(config)
+    raw = np.arange(24, dtype=np.uint8).reshape(2, 4, 3)
+    stream._publish_frame(raw)
+
+    view = stream.get_frame_view()
+    assert view is not None
+    assert not view.flags.writeable
+    assert np.array_equal(view, cv2.rotate(raw, cv2.ROTATE_90_CLOCKWISE))
+    assert np.shares_memory(view, stream._frame_slots)
+    assert stream.get_frame_view(min_timestamp=stream.get_timestamp()) is None
+
+
+def test_gray_frames_expand_into_slot_after_transform():
+    config = CameraConfig(
+        camera_id="dummy",
+        device_index=99,
+        display_name="Dummy Cam",
+        transform=FrameTransform(rotate_code=cv2.ROTATE_90_CLOCKWISE, flip_horizontal=True),
+    )
+    stream = CameraStream(config)
+    gray = np.arange(24, dtype=np.uint8).reshape(4, 6)
+    stream._publish_gray_as_bgr(gray)
+
+    expected = cv2.flip(cv2.rotate(cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR), cv2.ROTATE_90_CLOCKWISE), 1)
+    view = stream.get_frame_view()
+    assert np.array_equal(view, expected)
+    assert np.shares_memory(view, stream._frame_slots)
+
+
+def test_gray_pixel_format_keeps_single_plane():
+    config = CameraConfig(camera_id="dummy", device_index=99, display_name="Dummy Cam", pixel_format="gray")
+    stream = CameraStream(config)
+    bgr = np.zeros((4, 6, 3), dtype=np.uint8)
+    bgr[..., 2] = 200
+    stream._publish_frame(bgr)
+
+    view = stream.get_frame_view()
+    assert view.shape == (4, 6)
+    assert np.array_equal(view, cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY))
+
+
+def test_compiled_transform_matches_sequential_ops():
+    raw = np.arange(5 * 7 * 3, dtype=np.uint8).reshape(5, 7, 3)
+    rotations = [None, cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_180, cv2.ROTATE_90_COUNTERCLOCKWISE]
+    for rotate_code, flip_h, flip_v in itertools.product(rotations, (False, True), (False, True)):
+        expected = raw if rotate_code is None else cv2.rotate(raw, rotate_code)
+        if flip_h:
+            expected = cv2.flip(expected, 1)
+        if flip_v:
+            expected = cv2.flip(expected, 0)
+
+        out = np.empty_like(expected)
+        _compile_transform(FrameTransform(rotate_code, flip_h, flip_v))(raw, out)
+        assert np.array_equal(out, expected), (rotate_code, flip_h, flip_v)
+
+
+def test_frame_ring_keeps_order_and_counts_overwrites():
+    ring = FrameRing((2, 2), capacity=6)
+    for value in range(1, 4):
+        assert ring.push(np.full((2, 2), value, dtype=np.uint8), float(value))
+    assert not ring.push(np.zeros((3, 3), dtype=np.uint8), 0.0)
+    assert ring.rejected == 1
+
+    frame, timestamp = ring.pop()
+    assert frame[0, 0] == 1 and timestamp == 1.0
+    assert not frame.flags.writeable
+
+    for value in range(4, 10):
+        ring.push(np.full((2, 2), value, dtype=np.uint8), float(value))
+    # Frames within RING_SAFETY_MARGIN pushes of being overwritten are skipped and counted
+    assert [ring.pop()[1] for _ in range(4)] == [6.0, 7.0, 8.0, 9.0]
+    assert ring.dropped == 4
+    assert ring.pop() is None
+
+
+def test_frame_ring_counts_frames_after_resolution_change():
+    stream = CameraStream(CameraConfig(camera_id="dummy", device_index=99, display_name="Dummy Cam"))
+    ring = FrameRing((4, 4, 3), capacity=6)
+    stream.attach_ring(ring)
+
+    stream._publish_frame(np.zeros((4, 4, 3), dtype=np.uint8))
+    for _ in range(2):
+        stream._publish_frame(np.zeros((8, 8, 3), dtype=np.uint8))
+
+    assert len(ring) == 1
+    assert ring.rejected == 2
+    assert ring.dropped == 0
+
+
+def test_algorithm_state_frame_shapes_table():
+    state = AlgorithmState("algo", "Algo", "", required_cameras=["eye0", "world"])
+    assert state.required_cameras == ("eye0", "world")
+    assert state.last_frame_shapes == {}
+
+    state.set_frame_shape("eye0", (400, 400, 3))
+    state.set_frame_shape("world", None)
+    state.set_frame_shape("unknown", (1, 1, 1))
+    assert state.last_frame_shapes == {"eye0": (400, 400, 3), "world": None}
+
+    state.set_frame_shape("world", (480, 640))
+    assert state.last_frame_shapes["world"] == (480, 640)
+
+
+def test_algorithm_default_cameras_track_frame_shapes():
+    manager = AlgorithmManager(DummyCameraManager())
+    state = AlgorithmState("algo", "Algo", "")
+    manager._states["algo"] = state
+
+    frames = manager.get_latest_frames("algo")
+    assert state.required_cameras == ("dummy",)
+    assert frames == {"dummy": None}
+    assert state.last_frame_shapes == {"dummy": None}
+
+
 def test_nmea_to_decimal():
     lat = system_info._nmea_to_decimal("3723.2475", "N")
     lon = system_info._nmea_to_decimal("12158.3416", "W")
@@ -59,3 +271,155 @@ def test_parse_nmea_sentences_combines_rmc_and_gga():
     assert abs(parsed["longitude"] - (-121.97236)) < 1e-5
     assert abs(parsed["altitude_m"] - 18.2) < 1e-6
 
+
+def test_parse_nmea_sentences_prefers_newest_valid_fix():
+    sentences = [
+        "$GPGGA,022517.00,3723.2475,N,12158.3416,W,1,05,1.5,18.2,M,-25.7,M,,*76",
+        "$GPGGA,022518.00,3723.2475,N,12158.3416,W,2,09,0.9,20.0,M,-25.7,M,,*76",
+        "$GPRMC,022518.00,V,,,,,,,191194,,,N*68",
+    ]
+    parsed = system_info._parse_nmea_sentences(sentences)
+    assert parsed["satellites"] == 9
+    assert "speed_kmh" not in parsed
+
+
+class ScriptedSerialPort:
+    """Replays one chunk (or b"" for silence) per read()."""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def reset_input_buffer(self):
+        pass
+
+    def read(self, size):
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+def test_nmea_burst_skips_fragment_in_progress_at_reset():
+    rmc = b"$GPRMC,022518.00,A,3723.2475,N,12158.3416,W,0.123,54.7,191194,,,A*68\r\n"
+    gga = b"$GPGGA,022518.00,3723.2475,N,12158.3416,W,1,05,1.5,18.2,M,-25.7,M,,*76\r\n"
+    silence = [b""] * 10
+    port = ScriptedSerialPort([gga[20:], *silence, rmc, gga, *silence, b"$GPRMC,next"])
+
+    data = system_info._read_nmea_burst(port, timeout=1.0)
+    assert data == rmc + gga
+
+
+def test_parse_nmea_datetime_fractional_seconds():
+    assert system_info._parse_nmea_datetime("022517.2", "191194").endswith("02:25:17.200000+00:00")
+    assert system_info._parse_nmea_datetime("022517.29", "191194").endswith("02:25:17.290000+00:00")
+    assert system_info._parse_nmea_datetime("022517.123", "191194").endswith("02:25:17.123000+00:00")
+    assert system_info._parse_nmea_datetime("022517", "191194").endswith("02:25:17+00:00")
+
+
+def _write_power_supply(base: Path, name: str, **attributes: str) -> None:
+    entry = base / name
+    entry.mkdir()
+    for attribute, value in {"type": "Battery", **attributes}.items():
+        (entry / attribute).write_text(f"{value}\n")
+
+
+def test_sysfs_battery_percentage_uses_integer_math(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(system_info, "_has_power_supply_dir", lambda: True)
+    cases = (
+        ("charge", "29", "100", "29%"),
+        ("energy", "0", "5000", "0%"),
+        ("energy", "5000", "5000", "100%"),
+    )
+    for index, (kind, current, full, expected) in enumerate(cases):
+        base = tmp_path / str(index)
+        base.mkdir()
+        _write_power_supply(base, "BAT0", **{f"{kind}_now": current, f"{kind}_full": full})
+        monkeypatch.setattr(system_info, "POWER_SUPPLY_DIR", base)
+        assert system_info._read_sysfs_battery() == expected
+
+
+def test_upower_percentage_accepts_integer_and_decimal(monkeypatch):
+    reports = {}
+
+    def fake_run(cmd, timeout, check=True):
+        if cmd[1] == "-e":
+            return "/org/freedesktop/UPower/devices/battery_BAT0\n"
+        return reports["details"]
+
+    monkeypatch.setattr(system_info, "_which_cached", lambda name: "/usr/bin/upower")
+    monkeypatch.setattr(system_info, "_run_probe_command", fake_run)
+
+    reports["details"] = "  native-path:          BAT0\n    Percentage:          87.5%\n"
+    assert system_info._read_upower_battery() == "87%"
+    reports["details"] = "  native-path:          BAT0\n    percentage:          64%\n"
+    assert system_info._read_upower_battery() == "64%"
+
+
+def test_device_status_cached_until_ttl_expires(monkeypatch):
+    now = [100.0]
+    probes = []
+
+    def fake_collect():
+        probes.append(now[0])
+        return object()
+
+    monkeypatch.setattr(system_info.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(system_info, "_collect_device_status", fake_collect)
+    monkeypatch.setattr(system_info, "_STATUS_CONFIG", system_info._StatusConfig(ttl=3.0))
+    monkeypatch.setattr(system_info, "_STATUS_CACHE", None)
+
+    first = system_info.get_device_status()
+    now[0] += 2.9
+    assert system_info.get_device_status() is first
+    now[0] += 0.2
+    assert system_info.get_device_status() is not first
+    assert len(probes) == 2
+
+
+def _process_gone(pid: int, timeout: float = 1.0) -> bool:
+    # SIGKILL delivery to the rest of the group is asynchronous, so allow it a moment
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            status = Path(f"/proc/{pid}/status").read_text()
+        except OSError:
+            return True
+        # An orphan may linger as a zombie until init reaps it; it is no longer running either way
+        if "\nState:\tZ" in status:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+
+
+def test_hardinfo_stream_stops_early_and_on_timeout(tmp_path: Path, monkeypatch):
+    child_pid_file = tmp_path / "child.pid"
+    script = tmp_path / "hardinfo"
+    script.write_text(
+        "#!/bin/sh\n"
+        f"sleep 30 & echo $! > {child_pid_file}\n"
+        "echo 'Processor : Test CPU'\n"
+        "echo 'Memory : 1024 MB'\n"
+        "sleep 30\n"
+    )
+    script.chmod(0o755)
+
+    started = []
+    real_popen = subprocess.Popen
+
+    def recording_popen(*args, **kwargs):
+        proc = real_popen(*args, **kwargs)
+        started.append(proc)
+        return proc
+
+    monkeypatch.setattr(system_info, "_which_cached", lambda name: str(script))
+    monkeypatch.setattr(system_info.subprocess, "Popen", recording_popen)
+
+    for allow_overflow, expected in ((False, [("Processor", "Test CPU"), ("Memory", "1024 MB")]), (True, [])):
+        config = system_info._HardinfoConfig(
+            sections=("devices.cpu",), summary_limit=2, allow_overflow=allow_overflow, timeout=0.5
+        )
+        monkeypatch.setattr(system_info, "_HARDINFO_CONFIG", config)
+
+        began = time.monotonic()
+        assert system_info._collect_hardinfo_summary() == expected
+        assert time.monotonic() - began < 5.0
+        assert started[-1].returncode is not None
+        assert _process_gone(int(child_pid_file.read_text()))
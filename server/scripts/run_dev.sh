@@ -13,5 +13,5 @@ else
   source .venv/bin/activate
 fi
 
-exec uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+exec uvicorn app.main:app --reload --host 0.0.0.0 --port 8000 --loop auto --http auto --timeout-keep-alive 75
 
@@ -1,6 +1,12 @@
 import cv2
+import functools
 import numpy as np
 import os
+import queue
+import re
+import shutil
+import subprocess
+import threading
 from datetime import datetime
 
 capworld = cv2.VideoCapture(0)
@@ -26,6 +32,94 @@ is_recording = False
 video_writers = None
 record_folder = None
 
+class CameraReader:
+    """后台线程持续读取一路摄像头并做旋转/翻转，只保留最新一帧"""
+
+    def __init__(self, cap, transform, new_frame):
+        self.cap = cap
+        self.transform = transform
+        self.lock = threading.Lock()
+        self.frame = None
+        # 每发布一帧加一，并通知预览循环重绘
+        self.seq = 0
+        self.new_frame = new_frame
+        self.failed = False
+        self.running = True
+        # 录制时由采集线程直接把每一帧交给写入线程，不受预览刷新率影响
+        self.writer = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while self.running:
+            ret, frame = self.cap.read()
+            if not ret:
+                self.failed = True
+                return
+            frame = self.transform(frame)
+            with self.lock:
+                self.frame = frame
+                self.seq += 1
+                writer = self.writer
+            self.new_frame.set()
+            if writer is not None:
+                writer.put(frame)
+
+    def latest(self):
+        with self.lock:
+            return self.frame, self.seq
+
+    def stop(self):
+        # 先让线程退出 read()，再释放摄像头
+        self.running = False
+        self.thread.join(timeout=1.0)
+
+
+class FrameWriter:
+    """独立线程执行 VideoWriter.write；队列满时丢帧而不是阻塞采集"""
+
+    def __init__(self, video_writer, max_queue=4):
+        self.video_writer = video_writer
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            frame = self.queue.get()
+            if frame is None:
+                return
+            self.video_writer.write(frame)
+
+    def put(self, frame):
+        try:
+            self.queue.put_nowait(frame)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        self.video_writer.release()
+
+
+def flip_world(frame):
+    # 上下+左右翻转合并为一次原地 180° 翻转
+    return cv2.flip(frame, -1, frame)
+
+
+def rotate_eye(frame):
+    return cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
+
+
+new_frame = threading.Event()
+reader_cam1 = CameraReader(capcam1, rotate_eye, new_frame)
+reader_cam2 = CameraReader(capcam2, rotate_eye, new_frame)
+reader_world = CameraReader(capworld, flip_world, new_frame)
+readers = (reader_cam1, reader_cam2, reader_world)
+
+
 def create_record_folder():
     """Create a timestamped folder in the record directory"""
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -33,80 +127,114 @@ def create_record_folder():
     os.makedirs(record_dir, exist_ok=True)
     return record_dir
 
+# 可用的硬件 H.264 编码器（GStreamer 元素名, 编码管线片段），按优先级排列
+HW_ENCODERS = (
+    ("nvh264enc", "videoconvert ! nvh264enc"),
+    ("vaapih264enc", "videoconvert ! video/x-raw,format=NV12 ! vaapih264enc"),
+    ("vtenc_h264_hw", "videoconvert ! vtenc_h264_hw"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def detect_hw_encoder():
+    """Return the GStreamer fragment of the first available hardware H.264 encoder, or None"""
+    if not re.search(r"GStreamer:\s*YES", cv2.getBuildInformation()):
+        return None
+    inspect = shutil.which("gst-inspect-1.0")
+    if inspect is None:
+        return None
+    for element, fragment in HW_ENCODERS:
+        try:
+            result = subprocess.run([inspect, element], stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL, timeout=5.0, check=False)
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if result.returncode == 0:
+            print(f"录制使用硬件编码器: {element}")
+            return fragment
+    return None
+
+
+def open_video_writer(path, fps, size):
+    """依次尝试 GStreamer 硬件编码、FFmpeg 硬件加速 H.264，最后回退到软件 mp4v"""
+    fragment = detect_hw_encoder()
+    if fragment is not None:
+        pipeline = f'appsrc ! {fragment} ! h264parse ! mp4mux ! filesink location="{path}"'
+        writer = cv2.VideoWriter(pipeline, cv2.CAP_GSTREAMER, 0, fps, size)
+        if writer.isOpened():
+            return writer
+        writer.release()
+
+    writer = cv2.VideoWriter(
+        path, cv2.CAP_FFMPEG, cv2.VideoWriter_fourcc(*'avc1'), fps, size,
+        [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
+    if writer.isOpened():
+        return writer
+    writer.release()
+
+    return cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), fps, size)
+
+
+def output_size(cap, swap_axes):
+    """Writer (width, height) from the capture's negotiated resolution, or None if unknown"""
+    w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    if w <= 0 or h <= 0:
+        return None
+    return (h, w) if swap_axes else (w, h)
+
 def initialize_video_writers(record_dir):
     """Initialize video writers for the three cameras"""
-    # Get frame properties for video writer setup
-    ret1, frame_cam1 = capcam1.read()
-    ret2, frame_cam2 = capcam2.read()
-    ret3, frame_world = capworld.read()
+    # 直接按驱动协商的分辨率计算输出尺寸：眼部相机旋转 90° 后宽高互换，世界相机 180° 翻转尺寸不变
+    size_cam1 = output_size(capcam1, swap_axes=True)
+    size_cam2 = output_size(capcam2, swap_axes=True)
+    size_world = output_size(capworld, swap_axes=False)
 
-    if not (ret1 and ret2 and ret3):
+    if not (size_cam1 and size_cam2 and size_world):
         return None
-    
-    # Apply transformations to get actual frame dimensions
-    frame_world = cv2.flip(frame_world, 0)
-    frame_world = cv2.flip(frame_world, 1)
-    frame_cam1 = cv2.rotate(frame_cam1, cv2.ROTATE_90_CLOCKWISE)
-    frame_cam2 = cv2.rotate(frame_cam2, cv2.ROTATE_90_CLOCKWISE)
-    
-    # Define codec and fps
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+
+    # Define fps; the codec is picked per writer by open_video_writer
     fps = 30.0
-    
+
     # Initialize video writers
-    eye0_writer = cv2.VideoWriter(
-        os.path.join(record_dir, "eye0.mp4"),
-        fourcc, fps, 
-        (frame_cam1.shape[1], frame_cam1.shape[0])
-    )
-    
-    eye1_writer = cv2.VideoWriter(
-        os.path.join(record_dir, "eye1.mp4"),
-        fourcc, fps,
-        (frame_cam2.shape[1], frame_cam2.shape[0])
-    )
-    
-    world_writer = cv2.VideoWriter(
-        os.path.join(record_dir, "world.mp4"),
-        fourcc, fps,
-        (frame_world.shape[1], frame_world.shape[0])
-    )
-    
-    return eye0_writer, eye1_writer, world_writer
+    eye0_writer = open_video_writer(os.path.join(record_dir, "eye0.mp4"), fps, size_cam1)
+    eye1_writer = open_video_writer(os.path.join(record_dir, "eye1.mp4"), fps, size_cam2)
+    world_writer = open_video_writer(os.path.join(record_dir, "world.mp4"), fps, size_world)
 
-print("按 'c' 开始录制，按 'q' 停止录制并退出")
+    return FrameWriter(eye0_writer), FrameWriter(eye1_writer), FrameWriter(world_writer)
 
-while True:
-    ret1, frame_cam1 = capcam1.read()
-    ret2, frame_cam2 = capcam2.read()
-    ret3_world, frame_world = capworld.read()
-    frame_world = cv2.flip(frame_world, 0)
-    frame_world = cv2.flip(frame_world, 1)
-    frame_cam1 = cv2.rotate(frame_cam1, cv2.ROTATE_90_CLOCKWISE)
-    frame_cam2 = cv2.rotate(frame_cam2, cv2.ROTATE_90_CLOCKWISE)
+print("按 'c' 开始录制，按 'q' 停止录制并退出")
 
+# 预览画布只分配一次，三路画面直接缩放进各自的区域
+combined = np.empty((240, 960, 3), dtype=np.uint8)
+# 上次显示时各路帧序号及录制状态，没有变化就不重复缩放/显示
+shown_seqs = None
 
-    if not ret1 or not ret2 or not ret3_world:
+while True:
+    if any(reader.failed for reader in readers):
         print("错误：无法接收帧。")
         break
 
-    f1s = cv2.resize(frame_cam1, (320, 240))
-    f2s = cv2.resize(frame_cam2, (320, 240))
-    ws  = cv2.resize(frame_world, (320, 240))
-    combined = np.hstack([f1s, f2s, ws])
-    
-    # Add recording status text to display
-    status_text = "Recording..." if is_recording else "Press 'c' to start recording"
-    cv2.putText(combined, status_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0) if is_recording else (255, 255, 255), 2)
-    
-    cv2.imshow("Eye0 | Eye1 | World", combined)
-    
-    # Write frames if recording
-    if is_recording and video_writers is not None:
-        eye0_writer, eye1_writer, world_writer = video_writers
-        eye0_writer.write(frame_cam1)
-        eye1_writer.write(frame_cam2)
-        world_writer.write(frame_world)
+    # 只有采集线程发布了新帧才重绘；超时只是为了继续响应按键
+    new_frame.wait(0.05)
+    new_frame.clear()
+
+    (frame_cam1, seq_cam1), (frame_cam2, seq_cam2), (frame_world, seq_world) = (
+        reader.latest() for reader in readers
+    )
+    seqs = (seq_cam1, seq_cam2, seq_world, is_recording)
+    if frame_cam1 is not None and frame_cam2 is not None and frame_world is not None and seqs != shown_seqs:
+        shown_seqs = seqs
+        cv2.resize(frame_cam1, (320, 240), dst=combined[:, 0:320])
+        cv2.resize(frame_cam2, (320, 240), dst=combined[:, 320:640])
+        cv2.resize(frame_world, (320, 240), dst=combined[:, 640:960])
+
+        # Add recording status text to display
+        status_text = "Recording..." if is_recording else "Press 'c' to start recording"
+        cv2.putText(combined, status_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0) if is_recording else (255, 255, 255), 2)
+
+        cv2.imshow("Eye0 | Eye1 | World", combined)
 
     key = cv2.waitKey(1) & 0xFF
     
@@ -116,6 +244,9 @@ while True:
         record_folder = create_record_folder()
         video_writers = initialize_video_writers(record_folder)
         if video_writers is not None:
+            for reader, writer in zip(readers, video_writers):
+                with reader.lock:
+                    reader.writer = writer
             is_recording = True
             print(f"开始录制到文件夹: {record_folder}")
         else:
@@ -124,13 +255,17 @@ while True:
     elif key == ord('q'):
         # Stop recording and quit
         if is_recording and video_writers is not None:
-            eye0_writer, eye1_writer, world_writer = video_writers
-            eye0_writer.release()
-            eye1_writer.release()
-            world_writer.release()
-            print(f"录制完成，文件保存在: {record_folder}")
+            for reader in readers:
+                with reader.lock:
+                    reader.writer = None
+            for writer in video_writers:
+                writer.close()
+            dropped = sum(writer.dropped for writer in video_writers)
+            print(f"录制完成，文件保存在: {record_folder}（丢弃 {dropped} 帧）")
         break
 
+for reader in readers:
+    reader.stop()
 capcam1.release()
 capcam2.release()
 capworld.release()